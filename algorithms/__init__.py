@@ -1,9 +1,17 @@
 
+# ----- Graph representation -----
+from .compact_graph import CompactGraph
+from .base import CliqueResult
+from .budget import Budget
+from .ordering import core_numbers, degeneracy_ordering, degeneracy, coloring_bound
+
 # ----- Exact Algorithms -----
 from .exact.brute_force import BruteForceClique
 from .exact.backtracking import BacktrackingClique
 from .exact.divide_conquer import DivideConquerClique
 from .exact.dp_bitmask import DPCliqueBitmask
+from .exact.coloring_branch_bound import ColoringBranchBoundClique
+from .exact.bitboard_branch_bound import BitParallelClique
 
 # ----- Heuristics: Greedy -----
 from .heuristics.greedy.greedy_degree import GreedyCliqueDegree
@@ -19,18 +27,46 @@ from .heuristics.enhancement.local_search import LocalSearchClique
 
 # ----- Metaheuristics -----
 from .heuristics.metaheuristics.genetic_algorithm import GeneticAlgorithmClique
+from .heuristics.metaheuristics.vectorized_genetic import VectorizedGeneticAlgorithmClique
+from .heuristics.metaheuristics.dynamic_local_search import DynamicLocalSearchClique
+
+# ----- Portfolio -----
+from .portfolio import PortfolioClique
+
+# ----- Preprocessing -----
+from .preprocessing import preprocess, PreprocessedClique, ReductionReport
+
+# ----- Selection -----
+from .selection import AutoClique, graph_features
 
 
 __all__ = [
+    "CompactGraph",
+    "CliqueResult",
+    "Budget",
+    "core_numbers",
+    "degeneracy_ordering",
+    "degeneracy",
+    "coloring_bound",
     "BruteForceClique",
     "BacktrackingClique",
     "DivideConquerClique",
     "DPCliqueBitmask",
+    "ColoringBranchBoundClique",
+    "BitParallelClique",
     "GreedyCliqueDegree",
     "GreedyCliqueWithRestarts",
     "GreedyCliqueMinDegree",
     "GreedyCliqueCoreDecomposition",
     "ColoringHeuristicClique",
     "LocalSearchClique",
-    "GeneticAlgorithmClique"
+    "GeneticAlgorithmClique",
+    "VectorizedGeneticAlgorithmClique",
+    "DynamicLocalSearchClique",
+    "PortfolioClique",
+    "preprocess",
+    "PreprocessedClique",
+    "ReductionReport",
+    "AutoClique",
+    "graph_features"
 ]
@@ -1,11 +1,201 @@
-from typing import Set, Dict
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Dict, Tuple, Union
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+
+GraphLike = Union[Dict[int, Set[int]], CompactGraph]
+
+
+class CliqueResult(set):
+    """
+    Clique devolvida por ``run()`` junto com o que se sabe sobre ela.
+
+    Continua sendo um ``set`` de vértices (quem só usa a clique não muda),
+    mas carrega ``upper_bound``, um limite superior para o tamanho da clique
+    máxima (None se desconhecido), e ``optimal``, verdadeiro quando a clique
+    tem tamanho comprovadamente máximo.
+    """
+
+    def __init__(self, clique: Iterable = (), upper_bound: Optional[int] = None, optimal: bool = False):
+        super().__init__(clique)
+        self.upper_bound = upper_bound
+        self.optimal = optimal
+
+
+class SearchInterrupted(Exception):
+    """Levantada por ``_tick()`` quando o orçamento da execução se esgota."""
+
+
+# A cada quantas chamadas de _tick() o orçamento é consultado de fato.
+_TICK_INTERVAL = 256
+
+# Sentinela que marca o fim da execução em iter_incumbents().
+_DONE = object()
+
+
+def _make_budget(timeout: Optional[float], budget: Optional[Budget]) -> Optional[Budget]:
+    """Budget da execução a partir de ``timeout`` (segundos) ou ``budget``."""
+    if timeout is None:
+        return budget
+    if budget is not None:
+        raise ValueError("Informe timeout ou budget, não os dois.")
+    if timeout < 0:
+        raise ValueError(f"timeout deve ser >= 0 segundos, recebido {timeout}.")
+    return Budget(timeout=timeout)
+
 
 class CliqueAlgorithm:
-    """Interface mínima para algoritmos de clique."""
-    def __init__(self, graph: Dict[int, Set[int]]):
-        # Normaliza grafo para conjuntos
-        self.graph = {v: set(neigh) for v, neigh in graph.items()}
+    """
+    Interface mínima para algoritmos de clique.
+
+    Interface "anytime": ``run(budget=..., on_improvement=...)`` aceita um
+    ``Budget`` (prazo + cancelamento; ``timeout=``, em segundos a partir da
+    chamada, é um atalho para um Budget só com prazo) e uma função chamada
+    com ``(segundos desde o início, clique)`` a cada melhora do incumbente.
+    Se o orçamento acaba, ``run`` devolve a melhor clique encontrada até ali
+    e marca ``timed_out``. ``iter_incumbents()`` entrega as mesmas melhoras
+    como um gerador.
 
-    def run(self) -> Set[int]:
+    As subclasses implementam ``_solve()``, reportam cliques com
+    ``_improve()`` e chamam ``_tick()`` nos laços longos.
+    """
+    def __init__(self, graph: GraphLike):
+        # Normaliza o grafo para a representação compacta (bitsets + CSR).
+        # Um CompactGraph (ou visão induzida) é imutável, então é usado
+        # diretamente, sem cópia, mesmo quando compartilhado entre solvers.
+        if isinstance(graph, CompactGraph):
+            self.compact = graph
+        else:
+            self.compact = CompactGraph.from_dict(graph)
+        self._graph = None
+        self.budget: Optional[Budget] = None
+        self.on_improvement: Optional[Callable[[float, Set], None]] = None
+        self.timed_out = False
+        self._best_labels: Set = set()
+        self._started = time.monotonic()
+        self._ticks = 0
+
+    @property
+    def graph(self) -> Dict[int, Set[int]]:
+        """Visão dict-de-conjuntos (rótulos originais), montada sob demanda."""
+        if self._graph is None:
+            self._graph = self.compact.to_dict()
+        return self._graph
+
+    # ----------------------------------------------------
+    # Interface anytime
+    # ----------------------------------------------------
+    def run(
+        self,
+        timeout: Optional[float] = None,
+        on_improvement: Optional[Callable[[float, Set], None]] = None,
+        budget: Optional[Budget] = None,
+    ) -> Set:
         """Roda o algoritmo e retorna a clique máxima (conjunto de vértices)."""
+        self.budget = _make_budget(timeout, budget)
+        self.on_improvement = on_improvement
+        self.timed_out = False
+        self._best_labels = set()
+        self._started = time.monotonic()
+        self._ticks = 0
+        try:
+            result = self._solve()
+        except SearchInterrupted:
+            self.timed_out = True
+            return set(self._best_labels)
+        self._improve_labels(result)
+        return result
+
+    def iter_incumbents(
+        self, timeout: Optional[float] = None, budget: Optional[Budget] = None
+    ) -> Iterator[Tuple[float, Set]]:
+        """Executa ``run`` numa thread e gera ``(tempo, clique)`` a cada melhora.
+
+        A execução pertence ao gerador: fechá-lo (ou abandoná-lo) antes do fim
+        cancela o orçamento, e a thread do solver para no próximo ``_tick``.
+        Sem ``budget``, um orçamento próprio é criado para isso.
+        """
+        budget = _make_budget(timeout, budget) or Budget()
+        events: "queue.Queue" = queue.Queue()
+        failure: List[BaseException] = []
+
+        def target():
+            try:
+                self.run(budget=budget, on_improvement=lambda t, c: events.put((t, c)))
+            except BaseException as exc:
+                failure.append(exc)
+            finally:
+                events.put(_DONE)
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        finished = False
+        try:
+            while True:
+                event = events.get()
+                if event is _DONE:
+                    finished = True
+                    break
+                yield event
+        finally:
+            # Gerador fechado ou abandonado antes do fim: interrompe o solver
+            # em vez de deixá-lo buscando sem limite.
+            if not finished:
+                budget.cancel()
+        thread.join()
+        if failure:
+            raise failure[0]
+
+    def _solve(self) -> Set:
         raise NotImplementedError
+
+    def _tick(self):
+        """Interrompe a busca (SearchInterrupted) se o orçamento acabou.
+
+        O orçamento só é consultado a cada _TICK_INTERVAL chamadas, então
+        pode ser chamado em laços quentes.
+        """
+        if self.budget is None:
+            return
+        self._ticks += 1
+        if self._ticks % _TICK_INTERVAL == 0 and self.budget.expired():
+            raise SearchInterrupted()
+
+    def _budget_expired(self) -> bool:
+        """O orçamento já acabou? (sem interromper a busca)"""
+        return self.budget is not None and self.budget.expired()
+
+    def _check_budget(self):
+        """Como _tick(), mas consulta sempre: para laços de passos longos."""
+        if self._budget_expired():
+            raise SearchInterrupted()
+
+    def _improve(self, clique: Union[int, Iterable[int]]):
+        """Reporta uma clique (bitset ou índices compactos) se for melhor."""
+        if isinstance(clique, int):
+            if clique.bit_count() > len(self._best_labels):
+                self._improve_labels(self.compact.to_labels(clique))
+        else:
+            clique = list(clique)
+            if len(clique) > len(self._best_labels):
+                labels = self.compact.labels
+                self._improve_labels({labels[v] for v in clique})
+
+    def _improve_labels(self, clique: Iterable):
+        """Reporta uma clique já em rótulos originais se for melhor."""
+        clique = set(clique)
+        if len(clique) <= len(self._best_labels):
+            return
+        self._best_labels = clique
+        if self.on_improvement is not None:
+            self.on_improvement(time.monotonic() - self._started, set(clique))
+
+    def _run_inner(self, solver: "CliqueAlgorithm") -> Set:
+        """Roda um solver auxiliar sob o mesmo orçamento; repassa a interrupção."""
+        result = solver.run(budget=self.budget)
+        if solver.timed_out:
+            self._improve_labels(result)
+            raise SearchInterrupted()
+        return result
@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Optional
+
+
+class Budget:
+    """
+    Orçamento de execução e token de cancelamento de um solver.
+
+    Reúne um prazo (instante de ``time.monotonic()``) e um sinal de
+    cancelamento (``threading.Event``). Os solvers consultam ``expired()``
+    em intervalos limitados dos seus laços e devolvem a melhor clique
+    parcial quando o orçamento acaba, então não há sinais (SIGALRM) nem
+    restrição à thread principal: o mesmo Budget pode ser compartilhado
+    entre threads e cancelado de qualquer uma delas.
+
+    Entre processos só o prazo viaja: a cópia recebida por um trabalhador
+    tem um sinal de cancelamento próprio. Para cancelar trabalhadores, passe
+    em ``event`` um ``multiprocessing.Event`` herdado por eles (como faz o
+    PortfolioClique).
+    """
+
+    def __init__(self, timeout: Optional[float] = None, deadline: Optional[float] = None, event=None):
+        if timeout is not None:
+            limit = time.monotonic() + timeout
+            deadline = limit if deadline is None else min(deadline, limit)
+        self.deadline = deadline
+        self._cancelled = event if event is not None else threading.Event()
+
+    def __reduce__(self):
+        # threading.Event não é serializável; o trabalhador recebe só o prazo.
+        return (Budget, (None, self.deadline))
+
+    def cancel(self):
+        """Pede a interrupção de todos os solvers que usam este orçamento."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def expired(self) -> bool:
+        """O orçamento acabou (prazo esgotado ou cancelamento pedido)?"""
+        if self._cancelled.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """Segundos até o prazo (0 se esgotado, None se não há prazo)."""
+        if self._cancelled.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
@@ -0,0 +1,458 @@
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set
+
+import numpy as np
+
+
+# Tabela de popcount para bytes: usada nos caminhos NumPy (matriz empacotada).
+POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# Máscaras com mais de _WIDE_MASK_BITS de largura e mais de _WIDE_MASK_COUNT
+# bits ligados são desempacotadas com NumPy em iter_bits.
+_WIDE_MASK_BITS = 4096
+_WIDE_MASK_COUNT = 64
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Itera os índices dos bits ligados de ``mask`` em ordem crescente."""
+    if mask.bit_length() > _WIDE_MASK_BITS and mask.bit_count() > _WIDE_MASK_COUNT:
+        # Em máscaras largas cada passo abaixo copiaria o inteiro inteiro
+        # (O(popcount · n/64)); desempacotar os bytes é O(n/8) de uma vez.
+        raw = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) >> 3, "little"), dtype=np.uint8)
+        yield from np.flatnonzero(np.unpackbits(raw, bitorder="little")).tolist()
+        return
+    # Cada passo isola o bit menos significativo: O(popcount) iterações.
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_from_indices(indices: Iterable[int], nbytes: int) -> int:
+    """Monta um bitset a partir de índices usando um buffer de bytes.
+
+    Evita o custo de ``mask |= 1 << j`` repetido (cada OR realoca o inteiro
+    inteiro), ficando em O(|indices| + nbytes).
+    """
+    buf = bytearray(nbytes)
+    for j in indices:
+        buf[j >> 3] |= 1 << (j & 7)
+    return int.from_bytes(buf, "little")
+
+
+def popcount_array(words: np.ndarray) -> np.ndarray:
+    """Popcount elemento a elemento para arrays de inteiros sem sinal."""
+    words = np.ascontiguousarray(words)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (words.itemsize,))
+    return POPCOUNT8[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """Valores distintos de ``keys`` em ordem: sort + comparação com o vizinho.
+
+    Equivale a ``np.unique``, mas sem o caminho por hash das versões
+    recentes do NumPy, que é muito mais lento para dezenas de milhões de int64.
+    """
+    keys = np.sort(keys)
+    if not len(keys):
+        return keys
+    distinct = np.empty(len(keys), dtype=bool)
+    distinct[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+    return keys[distinct]
+
+
+def edges_to_csr(n: int, src: np.ndarray, dst: np.ndarray):
+    """
+    Arrays de arestas -> (indptr, indices) simétricos, em O(m log m) vetorizado:
+    as duas orientações de cada aresta são ordenadas por (origem, destino)
+    numa chave int64, o que também descarta laços e arestas repetidas.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    keys = sorted_unique(np.concatenate((src * n + dst, dst * n + src)))
+    rows, cols = np.divmod(keys, n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols.astype(np.int32)
+
+
+class CompactGraph:
+    """
+    Representação compacta e imutável de grafo não direcionado.
+
+    Os vértices são reindexados para 0..n-1 (``labels[i]`` guarda o rótulo
+    original) e a adjacência é mantida em três formas:
+      - ``masks``: um bitset (int do Python) por vértice;
+      - ``packed``: matriz de bits empacotada do NumPy (n x ceil(n/8));
+      - ``indptr``/``indices``: arrays CSR.
+
+    A forma CSR é montada na construção; bitsets e matriz empacotada são
+    derivados sob demanda, de modo que algoritmos O(n + m) não pagam O(n²).
+
+    O objeto é congelado e hashable, então pode ser repassado entre solvers
+    compostos sem cópia. ``induced(mask)`` devolve uma visão do subgrafo
+    induzido que compartilha as estruturas do grafo original: a visão mantém
+    o mesmo espaço de índices (``n``) e apenas restringe ``vertices``.
+    Os bitsets de uma visão são guardados só para os seus vértices, então
+    criar e consultar uma visão pequena não custa O(n).
+    """
+
+    __slots__ = (
+        "labels", "index", "_root", "_vertices",
+        "_masks", "_indptr", "_indices", "_packed", "_hash",
+    )
+
+    def __init__(
+        self,
+        labels: Sequence[Hashable],
+        masks: Optional[Sequence[int]] = None,
+        indptr: Optional[np.ndarray] = None,
+        indices: Optional[np.ndarray] = None,
+    ):
+        if masks is None and (indptr is None or indices is None):
+            raise ValueError("Informe os bitsets ou os arrays CSR do grafo.")
+        labels = tuple(labels)
+        self._set("labels", labels)
+        self._set("index", {v: i for i, v in enumerate(labels)})
+        self._set("_root", None)
+        self._set("_vertices", (1 << len(labels)) - 1)
+        self._set("_masks", tuple(masks) if masks is not None else None)
+        self._set("_indptr", _readonly(indptr))
+        self._set("_indices", _readonly(indices))
+        self._set("_packed", None)
+        self._set("_hash", None)
+
+    def _set(self, name, value):
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompactGraph é imutável; use induced() para restringir vértices.")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompactGraph é imutável.")
+
+    def __reduce__(self):
+        # Visões são serializadas como (grafo raiz, bitset de vértices),
+        # então o pickle nunca duplica a adjacência.
+        if self._root is not None:
+            return (_induced_view, (self._root, self._vertices))
+        return (CompactGraph, (self.labels, self._masks, self._indptr, self._indices))
+
+    # ----------------------------------------------------
+    # Construção
+    # ----------------------------------------------------
+    @classmethod
+    def from_dict(cls, graph: Dict[Hashable, Iterable[Hashable]]) -> "CompactGraph":
+        """Converte o formato dict-de-conjuntos usado pelos geradores."""
+        labels = list(graph.keys())
+        n = len(labels)
+
+        # Caminho rápido: rótulos já são 0..n-1 na ordem (caso dos geradores),
+        # então não precisamos traduzir cada vizinho por um dicionário.
+        identity = all(v == i for i, v in enumerate(labels))
+        index = None if identity else {v: i for i, v in enumerate(labels)}
+
+        counts = np.zeros(n + 1, dtype=np.int64)
+        rows: List[List[int]] = []
+        for i, v in enumerate(labels):
+            if identity:
+                row = [u for u in graph[v] if 0 <= u < n and u != i]
+            else:
+                row = [index[u] for u in graph[v] if u in index and index[u] != i]
+            row.sort()
+            rows.append(row)
+            counts[i + 1] = len(row)
+
+        indptr = np.cumsum(counts)
+        indices = np.fromiter(
+            (j for row in rows for j in row), dtype=np.int32, count=int(indptr[-1])
+        )
+        return cls(labels, indptr=indptr, indices=indices)
+
+    @classmethod
+    def from_csr(
+        cls, indptr: np.ndarray, indices: np.ndarray, labels: Optional[Sequence[Hashable]] = None
+    ) -> "CompactGraph":
+        """Usa arrays CSR já prontos (simétricos, linhas ordenadas, sem laços).
+
+        Os arrays não são copiados: o grafo guarda visões somente leitura
+        deles, e quem os passou não deve mais alterá-los.
+        """
+        n = len(indptr) - 1
+        return cls(range(n) if labels is None else labels, indptr=indptr, indices=indices)
+
+    @classmethod
+    def from_edges(
+        cls, n: int, src: np.ndarray, dst: np.ndarray, labels: Optional[Sequence[Hashable]] = None
+    ) -> "CompactGraph":
+        """Monta o grafo a partir de arrays de arestas (índices 0..n-1)."""
+        indptr, indices = edges_to_csr(n, src, dst)
+        return cls.from_csr(indptr, indices, labels)
+
+    def induced(self, mask: int) -> "CompactGraph":
+        """Visão do subgrafo induzido por ``mask`` (sem copiar adjacência)."""
+        root = self._root if self._root is not None else self
+        view = object.__new__(CompactGraph)
+        view._set("labels", root.labels)
+        view._set("index", root.index)
+        view._set("_root", root)
+        view._set("_vertices", mask & self._vertices)
+        view._set("_masks", None)
+        view._set("_indptr", None)
+        view._set("_indices", None)
+        view._set("_packed", None)
+        view._set("_hash", None)
+        return view
+
+    def subgraph(self, mask: int) -> "CompactGraph":
+        """Subgrafo induzido por ``mask`` materializado e reindexado para 0..k-1.
+
+        Use apenas quando o algoritmo depende do espaço de índices
+        (ex.: enumeração de 2^n máscaras); nos demais casos prefira induced().
+        """
+        keep = np.fromiter(iter_bits(mask & self._vertices), dtype=np.int64)
+        remap = np.full(self.n, -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        indptr, indices = self.indptr, self.indices
+        rows = [remap[indices[a:b]] for a, b in zip(indptr[keep], indptr[keep + 1])]
+        rows = [r[r >= 0] for r in rows]
+        counts = np.fromiter((len(r) for r in rows), dtype=np.int64, count=len(rows))
+        sub_indptr = np.concatenate(([0], np.cumsum(counts)))
+        sub_indices = (
+            np.concatenate(rows).astype(np.int32) if rows else np.zeros(0, dtype=np.int32)
+        )
+        labels = self.labels
+        return CompactGraph([labels[i] for i in keep.tolist()], indptr=sub_indptr, indices=sub_indices)
+
+    def compressed(self) -> "CompactGraph":
+        """O próprio grafo, ou a visão materializada em 0..k-1 se for visão."""
+        return self if self._root is None else self.subgraph(self._vertices)
+
+    # ----------------------------------------------------
+    # Estruturas derivadas (sob demanda)
+    # ----------------------------------------------------
+    @property
+    def n(self) -> int:
+        """Tamanho do espaço de índices (0..n-1), compartilhado pelas visões."""
+        return len(self.labels)
+
+    @property
+    def nbytes(self) -> int:
+        return (self.n + 7) >> 3
+
+    @property
+    def vertices(self) -> int:
+        """Bitset com os vértices do grafo (ou da visão)."""
+        return self._vertices
+
+    @property
+    def is_view(self) -> bool:
+        return self._root is not None
+
+    def vertex_indices(self) -> List[int]:
+        if self._root is None:
+            return list(range(self.n))
+        return list(iter_bits(self._vertices))
+
+    def __len__(self) -> int:
+        if self._root is None:
+            return self.n
+        return self._vertices.bit_count()
+
+    def _member_array(self) -> np.ndarray:
+        vbytes = np.frombuffer(self._vertices.to_bytes(self.nbytes, "little"), dtype=np.uint8)
+        return np.unpackbits(vbytes, bitorder="little")[: self.n].astype(bool)
+
+    @property
+    def masks(self):
+        """Bitsets de adjacência, já restritos aos vértices da visão.
+
+        Indexados pelo índice do vértice. Numa visão, é um dicionário com uma
+        entrada por vértice da visão (índices de fora devolvem 0).
+        """
+        if self._masks is None:
+            if self._root is not None:
+                self._set("_masks", self._view_masks())
+            else:
+                indptr, indices, nbytes = self._indptr.tolist(), self._indices.tolist(), self.nbytes
+                self._set("_masks", tuple(
+                    mask_from_indices(indices[indptr[i]:indptr[i + 1]], nbytes)
+                    for i in range(self.n)
+                ))
+        return self._masks
+
+    def _view_masks(self) -> "_ViewMasks":
+        # Lê só as linhas do CSR da raiz dos vértices da visão e mantém os
+        # vizinhos que estão na visão (busca binária no vetor ordenado de
+        # vértices): O(soma dos graus · log k), sem os bitsets da raiz.
+        vertices = np.array(self.vertex_indices(), dtype=np.int64)
+        if not vertices.size:
+            return _ViewMasks()
+        indptr, indices = self._root.indptr, self._root.indices
+        starts, ends = indptr[vertices].tolist(), indptr[vertices + 1].tolist()
+        counts = np.array([b - a for a, b in zip(starts, ends)], dtype=np.int64)
+        flat = (
+            np.concatenate([indices[a:b] for a, b in zip(starts, ends)]).astype(np.int64)
+            if counts.sum() else np.zeros(0, dtype=np.int64)
+        )
+        pos = np.minimum(np.searchsorted(vertices, flat), len(vertices) - 1)
+        keep = vertices[pos] == flat
+        owner = np.repeat(np.arange(len(vertices)), counts)[keep]
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(owner, minlength=len(vertices))))).tolist()
+        kept = flat[keep].tolist()
+        # Os bitsets só precisam cobrir até o maior índice da visão.
+        nbytes = (int(vertices[-1]) >> 3) + 1
+        return _ViewMasks(
+            (v, mask_from_indices(kept[bounds[i]:bounds[i + 1]], nbytes))
+            for i, v in enumerate(vertices.tolist())
+        )
+
+    @property
+    def indptr(self) -> np.ndarray:
+        if self._indptr is None:
+            self._build_csr()
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        if self._indices is None:
+            self._build_csr()
+        return self._indices
+
+    def _build_csr(self):
+        if self._root is not None:
+            # Filtra o CSR da raiz: mantém só arestas com as duas pontas na visão.
+            member = self._member_array()
+            root_indptr, root_indices = self._root.indptr, self._root.indices
+            rows = np.repeat(np.arange(self.n), np.diff(root_indptr))
+            keep = member[rows] & member[root_indices]
+            counts = np.bincount(rows[keep], minlength=self.n)
+            indptr = np.concatenate(([0], np.cumsum(counts)))
+            indices = root_indices[keep]
+        else:
+            # Desempacota cada linha da matriz de bits: O(n²/8) em C.
+            packed = self.packed
+            rows = [np.flatnonzero(np.unpackbits(packed[i], bitorder="little")) for i in range(self.n)]
+            counts = np.fromiter((len(r) for r in rows), dtype=np.int64, count=self.n)
+            indptr = np.concatenate(([0], np.cumsum(counts)))
+            indices = (
+                np.concatenate(rows).astype(np.int32) if rows else np.zeros(0, dtype=np.int32)
+            )
+        self._set("_indptr", _readonly(indptr))
+        self._set("_indices", _readonly(indices))
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Matriz de adjacência empacotada (bit j da linha i = aresta i-j).
+
+        Só existe para grafos materializados: a matriz de uma visão teria o
+        tamanho da raiz (n²/8 bytes). Use ``compressed().packed``.
+        """
+        if self._root is not None:
+            raise ValueError("Visões não têm matriz empacotada; use compressed().packed.")
+        if self._packed is None:
+            n, nbytes = self.n, self.nbytes
+            if self._masks is not None:
+                packed = np.zeros((n, nbytes), dtype=np.uint8)
+                for i, m in enumerate(self._masks):
+                    packed[i] = np.frombuffer(m.to_bytes(nbytes, "little"), dtype=np.uint8)
+            else:
+                packed = np.zeros((n, nbytes), dtype=np.uint8)
+                rows = np.repeat(np.arange(n), np.diff(self._indptr))
+                cols = self._indices.astype(np.int64)
+                np.bitwise_or.at(packed, (rows, cols >> 3), (1 << (cols & 7)).astype(np.uint8))
+            self._set("_packed", _readonly(packed))
+        return self._packed
+
+    # ----------------------------------------------------
+    # Igualdade e hash
+    # ----------------------------------------------------
+    def __hash__(self) -> int:
+        if self._hash is None:
+            if self._root is not None:
+                h = hash((hash(self._root), self._vertices))
+            else:
+                h = hash((self.labels, self.indptr.tobytes(), self.indices.tobytes()))
+            self._set("_hash", h)
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, CompactGraph):
+            return NotImplemented
+        if self._root is not None or other._root is not None:
+            return self._root == other._root and self._vertices == other._vertices
+        return (
+            self.labels == other.labels
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+        )
+
+    # ----------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------
+    def num_edges(self) -> int:
+        return int(self.indptr[-1]) // 2
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def degree(self, i: int) -> int:
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def adjacent(self, i: int, j: int) -> bool:
+        return bool((self.masks[i] >> j) & 1)
+
+    def is_clique(self, mask: int) -> bool:
+        """Testa se o bitset ``mask`` é clique: um AND por vértice."""
+        masks = self.masks
+        for i in iter_bits(mask):
+            if mask & ~masks[i] != (1 << i):
+                return False
+        return True
+
+    def to_mask(self, vertices: Iterable[Hashable]) -> int:
+        """Converte rótulos originais em bitset."""
+        return mask_from_indices((self.index[v] for v in vertices), self.nbytes)
+
+    def to_labels(self, mask: int) -> Set[Hashable]:
+        """Converte um bitset de índices no conjunto de rótulos originais."""
+        labels = self.labels
+        return {labels[i] for i in iter_bits(mask)}
+
+    def to_dict(self) -> Dict[Hashable, Set[Hashable]]:
+        labels, indptr, indices = self.labels, self.indptr.tolist(), self.indices.tolist()
+        return {
+            labels[i]: {labels[j] for j in indices[indptr[i]:indptr[i + 1]]}
+            for i in self.vertex_indices()
+        }
+
+
+class _ViewMasks(dict):
+    """Bitsets de uma visão: só os vértices da visão têm entrada; os demais
+    índices devolvem vizinhança vazia."""
+
+    __slots__ = ()
+
+    def __missing__(self, i: int) -> int:
+        return 0
+
+
+def _readonly(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    # Congela uma visão do array, não o array recebido: o chamador não tem
+    # o seu array tornado somente leitura por tabela.
+    if array is not None:
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def _induced_view(root: CompactGraph, vertices: int) -> CompactGraph:
+    return root.induced(vertices)
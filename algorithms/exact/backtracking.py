@@ -1,23 +1,144 @@
-from typing import Set, Dict
-from algorithms.base import CliqueAlgorithm
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Set, Tuple
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+
+# A cada quantos nós um trabalhador relê o incumbente compartilhado.
+_SYNC_INTERVAL = 256
+
+# Solver reaproveitado por cada processo trabalhador (criado no initializer).
+_WORKER_SOLVER: Optional["BacktrackingClique"] = None
+
+
+def _init_worker(graph: CompactGraph, incumbent, budget: Optional[Budget]):
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = BacktrackingClique(graph)
+    _WORKER_SOLVER.incumbent = incumbent
+    _WORKER_SOLVER.budget = budget
+
+
+def _solve_task(task: Tuple[int, int, int]) -> Tuple[int, int, bool]:
+    return _WORKER_SOLVER._solve_task(task)
+
 
 class BacktrackingClique(CliqueAlgorithm):
-    """Classe Backtracking já existente, adaptada para .run()."""
-    def __init__(self, graph: Dict[int, Set[int]]):
+    """
+    Classe Backtracking já existente, adaptada para .run().
+
+    Com ``max_workers > 1`` os primeiros ``split_depth`` níveis da árvore de
+    busca são transformados em tarefas independentes, distribuídas uma a uma
+    para um ProcessPoolExecutor (quem termina pega a próxima, então subárvores
+    grandes não travam os demais). Melhorias do incumbente são publicadas num
+    multiprocessing.Value e relidas periodicamente por todos os processos.
+    """
+    def __init__(self, graph: GraphLike, max_workers: int = 1, split_depth: int = 2):
         super().__init__(graph)
+        self.max_workers = max_workers
+        self.split_depth = split_depth
         # Ordenamos os vértices por grau decrescente.
         # Isso ajuda bastante na prática, mas não muda o pior caso assintótico:
         # mesmo ordenando, ainda podemos explorar quase todos os subconjuntos.
-        self.vertices = sorted(self.graph.keys(), key=lambda x: len(self.graph[x]), reverse=True)
-        self.best_clique: Set[int] = set()
-        self.current_clique: Set[int] = set()
+        degrees = self.compact.degrees()
+        self.vertices = sorted(self.compact.vertex_indices(), key=lambda x: degrees[x], reverse=True)
+        self.masks = self.compact.masks
+        # A clique atual e a melhor clique são bitsets sobre os índices compactos.
+        self.best_clique = 0
+        self.best_size = 0
+        self.current_clique = 0
+        self.current_size = 0
+        # Limite usado na poda: max(melhor própria, incumbente compartilhado).
+        self.bound = 0
+        self.incumbent = None
+        self._nodes = 0
 
-    def run(self) -> Set[int]:
-        return self.backtracking_max_clique()
+    def _solve(self) -> CliqueResult:
+        if self.max_workers > 1:
+            clique = self.parallel_max_clique()
+        else:
+            clique = self.backtracking_max_clique()
+        # Busca completa: nenhuma clique passa do limite de poda. Um incumbente
+        # externo pode tê-lo elevado sem clique local; aí não há prova.
+        bound = max(self.bound, self.best_size)
+        return CliqueResult(clique, upper_bound=bound, optimal=self.best_size >= bound)
 
     def backtracking_max_clique(self) -> Set[int]:
         self._backtrack(0)
-        return self.best_clique
+        return self.compact.to_labels(self.best_clique)
+
+    # ----------------------------------------------------
+    # Modo paralelo
+    # ----------------------------------------------------
+    def parallel_max_clique(self) -> Set[int]:
+        tasks: List[Tuple[int, int, int]] = []
+        self._split(0, 0, tasks)
+        incumbent = multiprocessing.Value("i", self.best_size)
+        interrupted = False
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.compact, incumbent, self.budget),
+        ) as executor:
+            # Uma tarefa por submit: a fila do pool faz o balanceamento dinâmico.
+            futures = [executor.submit(_solve_task, task) for task in tasks]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                size, clique, timed_out = future.result()
+                if timed_out and not interrupted:
+                    # Orçamento esgotado: as tarefas ainda na fila nem começam.
+                    interrupted = True
+                    for pending in futures:
+                        pending.cancel()
+                if size > self.best_size:
+                    self.best_clique, self.best_size = clique, size
+                    self._improve(clique)
+        # Trabalhadores que esgotaram o orçamento devolvem sua melhor clique
+        # parcial; o resultado só é exato se nenhum foi interrompido.
+        if interrupted:
+            raise SearchInterrupted()
+        return self.compact.to_labels(self.best_clique)
+
+    def _split(self, start_index: int, depth: int, tasks: List[Tuple[int, int, int]]):
+        # Mesma ramificação do _backtrack, mas parando em split_depth: cada
+        # nó nessa profundidade vira uma tarefa (clique, tamanho, próximo índice).
+        for i in range(start_index, len(self.vertices)):
+            vertex = self.vertices[i]
+            if self._can_add_to_clique(vertex):
+                self.current_clique |= 1 << vertex
+                self.current_size += 1
+                if self.current_size > self.best_size:
+                    self.best_clique = self.current_clique
+                    self.best_size = self.current_size
+                    self._improve(self.best_clique)
+                if depth + 1 >= self.split_depth:
+                    tasks.append((self.current_clique, self.current_size, i + 1))
+                else:
+                    self._split(i + 1, depth + 1, tasks)
+                self.current_clique ^= 1 << vertex
+                self.current_size -= 1
+
+    def _solve_task(self, task: Tuple[int, int, int]) -> Tuple[int, int, bool]:
+        clique, size, start_index = task
+        if self._budget_expired():
+            return 0, 0, True
+        self.current_clique, self.current_size = clique, size
+        self.best_clique, self.best_size = 0, 0
+        self.bound = self.incumbent.value
+        try:
+            self._backtrack(start_index)
+        except SearchInterrupted:
+            return self.best_size, self.best_clique, True
+        return self.best_size, self.best_clique, False
+
+    def _sync_incumbent(self):
+        # Publica a melhor clique local e relê a global (sob o lock do Value).
+        with self.incumbent.get_lock():
+            if self.best_size > self.incumbent.value:
+                self.incumbent.value = self.best_size
+            self.bound = max(self.bound, self.incumbent.value)
 
     def _backtrack(self, start_index: int):
         # PODA: se mesmo pegando todos os restantes não supero a best, retorno.
@@ -29,9 +150,15 @@ class BacktrackingClique(CliqueAlgorithm):
         #
         # Nesse cenário, o algoritmo vai explorar TODOS os subconjuntos possíveis.
 
-        if len(self.current_clique) + (len(self.vertices) - start_index) <= len(self.best_clique):
+        self._tick()
+        if self.incumbent is not None:
+            self._nodes += 1
+            if self._nodes % _SYNC_INTERVAL == 0:
+                self._sync_incumbent()
+
+        if self.current_size + (len(self.vertices) - start_index) <= self.bound:
             return
-        
+
         # Este loop tenta incluir ou não incluir cada vértice.
         # Essa decisão binária (incluir / não incluir) gera uma árvore de busca
         # com até 2ⁿ folhas no pior caso.
@@ -41,11 +168,17 @@ class BacktrackingClique(CliqueAlgorithm):
             # Isto é O(k) para clique atual de tamanho k,
             # mas isso é insignificante comparado à árvore exponencial gerada.
             if self._can_add_to_clique(vertex):
-                self.current_clique.add(vertex)
-                 # Atualiza melhor clique.
+                self.current_clique |= 1 << vertex
+                self.current_size += 1
+                # Atualiza melhor clique.
                 # Não muda a complexidade, apenas mantém o melhor tamanho.
-                if len(self.current_clique) > len(self.best_clique):
-                    self.best_clique = self.current_clique.copy()
+                if self.current_size > self.bound:
+                    self.best_clique = self.current_clique
+                    self.best_size = self.current_size
+                    self.bound = self.current_size
+                    if self.incumbent is not None:
+                        self._sync_incumbent()
+                    self._improve(self.best_clique)
                 # Chamamos recursivamente para o próximo vértice.
                 # Em um grafo completo, nada impede a inclusão,
                 # então todas as ramificações são visitadas.
@@ -53,13 +186,14 @@ class BacktrackingClique(CliqueAlgorithm):
                 # Isso significa que a árvore de recursão tem tamanho O(2ⁿ).
                 self._backtrack(i + 1)
                 # Remover o vértice faz parte do backtracking.
-                self.current_clique.remove(vertex)
+                self.current_clique ^= 1 << vertex
+                self.current_size -= 1
 
     def _can_add_to_clique(self, vertex: int) -> bool:
         # Checa se 'vertex' é adjacente a toda a clique atual.
-        # É O(k), mas novamente, irrelevante comparado ao custo exponencial.
+        # Com bitsets é um único AND: a clique precisa estar contida na vizinhança.
         #
         # Em grafos completos, este teste SEMPRE retorna True.
         # Isso permite que a árvore de recursão cresça ao máximo
-        return all(vertex in self.graph[v] for v in self.current_clique)
+        return self.current_clique & ~self.masks[vertex] == 0
 
@@ -0,0 +1,127 @@
+from typing import List, Tuple
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike
+from algorithms.compact_graph import iter_bits, mask_from_indices
+
+# A cada quantos nós o incumbente compartilhado (se houver) é relido.
+_SYNC_INTERVAL = 64
+
+
+class BitParallelClique(CliqueAlgorithm):
+    """
+    Branch-and-bound bit-paralelo (BBMC, San Segundo et al.).
+
+    Reaproveita a ideia de ``adj_masks`` do DPCliqueBitmask, mas aplicada a
+    branch-and-bound em vez de enumerar as 2^n máscaras: o conjunto de
+    candidatos é um bitset, a interseção com a vizinhança é um AND e a
+    coloração que serve de limite superior é feita com AND/ANDNOT sobre
+    palavras (os ints do Python operam em blocos de 30/64 bits em C).
+
+    ``lower_bound`` permite informar o tamanho de uma clique já conhecida:
+    apenas cliques estritamente maiores são procuradas. ``incumbent`` (um
+    multiprocessing.Value opcional) faz o mesmo durante a busca: o tamanho
+    compartilhado é relido periodicamente e vira limite de poda, e cada
+    melhora local é publicada nele.
+    """
+
+    def __init__(self, graph: GraphLike, lower_bound: int = 0):
+        super().__init__(graph)
+        self.lower_bound = lower_bound
+        # Renumeramos os vértices na ordem inicial (grau decrescente), de modo
+        # que o bit i dos bitsets internos corresponda a order[i]. Assim a
+        # coloração, que percorre os bits do menor para o maior, segue a ordem.
+        # Tudo é derivado dos bitsets (e não do CSR): para visões induzidas
+        # pequenas, como os subproblemas do DivideConquerClique, isso custa
+        # O(k) ANDs em vez de filtrar todas as arestas do grafo original.
+        masks = self.compact.masks
+        self.order = sorted(self.compact.vertex_indices(), key=lambda x: masks[x].bit_count(), reverse=True)
+        position = {v: i for i, v in enumerate(self.order)}
+        nbytes = (len(self.order) + 7) >> 3
+        self.adj: List[int] = [
+            mask_from_indices((position[u] for u in iter_bits(masks[v])), nbytes)
+            for v in self.order
+        ]
+        self.best_clique = 0
+        self.best_size = lower_bound
+        self.nodes = 0
+        self.incumbent = None
+
+    def _solve(self) -> CliqueResult:
+        n = len(self.order)
+        if n:
+            self._expand(0, 0, (1 << n) - 1)
+        labels = self.compact.labels
+        clique = {labels[v] for v in self._clique_indices(self.best_clique)}
+        # Busca completa: nenhuma clique passa de best_size. A clique local só
+        # é ótima se atinge esse valor (um lower_bound ou incumbente externo
+        # pode ter elevado best_size sem clique associada aqui).
+        return CliqueResult(clique, upper_bound=self.best_size, optimal=len(clique) >= self.best_size)
+
+    def _clique_indices(self, clique: int) -> List[int]:
+        # Bits internos são posições na ordem inicial: order[bit] = índice.
+        order = self.order
+        return [order[bit] for bit in iter_bits(clique)]
+
+    # ----------------------------------------------------
+    # Busca
+    # ----------------------------------------------------
+    def _expand(self, clique: int, size: int, candidates: int):
+        self._tick()
+        self.nodes += 1
+        if self.incumbent is not None and self.nodes % _SYNC_INTERVAL == 0:
+            self._sync_incumbent()
+        adj = self.adj
+        order, colors = self._color(candidates, size)
+
+        # Ramificamos do vértice de maior cor para o de menor cor.
+        for idx in range(len(order) - 1, -1, -1):
+            # PODA pelo limite de coloração: nenhum vértice anterior tem cor maior.
+            if size + colors[idx] <= self.best_size:
+                return
+            bit = 1 << order[idx]
+            new_candidates = candidates & adj[order[idx]]
+            if new_candidates:
+                self._expand(clique | bit, size + 1, new_candidates)
+            elif size + 1 > self.best_size:
+                self.best_clique = clique | bit
+                self.best_size = size + 1
+                self._improve(self._clique_indices(self.best_clique))
+                if self.incumbent is not None:
+                    self._sync_incumbent()
+            # ANDNOT: o vértice já explorado sai dos candidatos deste nó.
+            candidates &= ~bit
+
+    def _sync_incumbent(self):
+        # Publica o melhor tamanho local e adota o global como limite. Um
+        # limite vindo de fora não tem clique associada: best_clique só
+        # guarda cliques encontradas aqui, como com lower_bound.
+        with self.incumbent.get_lock():
+            if self.best_size > self.incumbent.value:
+                self.incumbent.value = self.best_size
+            self.best_size = max(self.best_size, self.incumbent.value)
+
+    def _color(self, candidates: int, size: int) -> Tuple[List[int], List[int]]:
+        """
+        Coloração sequencial bit-paralela: cada classe de cor é construída
+        retirando do conjunto ainda disponível o vértice de menor índice e
+        toda a sua vizinhança (ANDNOT). Só vértices com cor >= k_min podem
+        levar a uma clique melhor, então apenas eles são devolvidos.
+        """
+        adj = self.adj
+        k_min = self.best_size - size + 1
+        uncolored = candidates
+        order: List[int] = []
+        colors: List[int] = []
+        color = 0
+        while uncolored:
+            color += 1
+            available = uncolored
+            while available:
+                low = available & -available
+                v = low.bit_length() - 1
+                uncolored ^= low
+                available &= ~adj[v]
+                available ^= low
+                if color >= k_min:
+                    order.append(v)
+                    colors.append(color)
+        return order, colors
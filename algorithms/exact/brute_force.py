@@ -1,29 +1,48 @@
 import itertools
-from typing import Set, Dict
-from algorithms.base import CliqueAlgorithm
+from typing import Optional
+import numpy as np
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike
+from algorithms.compact_graph import CompactGraph, iter_bits, popcount_array
+
+# Bits da parte baixa de cada lote no modo "batch" (2^16 subconjuntos por lote).
+_LOW_BITS = 16
 
 class BruteForceClique(CliqueAlgorithm):
-    """Implementação em classe do brute-force já existente."""
-    def __init__(self, graph: Dict[int, Set[int]]):
+    """
+    Implementação em classe do brute-force já existente.
+
+    Modos:
+      - "classic": itertools.combinations + teste de clique por subconjunto.
+      - "batch": enumera as 2^n máscaras em lotes de arrays uint64 e testa
+        o lote inteiro de uma vez contra as máscaras de não-adjacência.
+        Continua sendo força bruta (todo subconjunto é testado), apenas sem
+        o overhead do interpretador por subconjunto. Limitado a n <= 63.
+    """
+
+    MODES = ("classic", "batch")
+
+    def __init__(self, graph: GraphLike, mode: str = "classic"):
         super().__init__(graph)
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de força bruta desconhecido: {mode}")
+        self.mode = mode
 
     @staticmethod
-    def _is_clique(graph: Dict[int, Set[int]], vertices: Set[int]) -> bool:
-        vertex_list = list(vertices)
-        # Este duplo loop verifica todos os pares dentro de um conjunto de tamanho k.
-        # Complexidade: O(k²), o que é pequeno comparado a gerar subconjuntos.
-
-        for i in range(len(vertex_list)):
-            for j in range(i + 1, len(vertex_list)):
-                u = vertex_list[i]
-                v = vertex_list[j]
-                if v not in graph[u]:
-                    return False
+    def _is_clique(graph: CompactGraph, vertices) -> bool:
+        masks = graph.masks
+        mask = 0
+        for v in vertices:
+            mask |= 1 << v
+        # Para cada vértice basta um AND: os demais membros precisam estar
+        # todos na sua vizinhança. Complexidade: O(k) operações de palavra,
+        # o que é pequeno comparado a gerar subconjuntos.
+        for v in vertices:
+            if mask & ~masks[v] != (1 << v):
+                return False
         return True
 
-    @staticmethod
-    def _brute_force_clique(graph: Dict[int, Set[int]], k: int):
-        vertices = list(graph.keys())
+    def _brute_force_clique(self, graph: CompactGraph, k: int) -> Optional[int]:
+        vertices = graph.vertex_indices()
         # Aqui está a principal fonte da complexidade exponencial:
         # itertools.combinations(vertices, k) gera TODAS as combinações possíveis
         # de k vértices dentre n vértices.
@@ -39,16 +58,69 @@ class BruteForceClique(CliqueAlgorithm):
         #
         # Portanto, só a geração das combinações já implica complexidade O(2ⁿ).
         for combination in itertools.combinations(vertices, k):
-            candidate_set = set(combination)
-            # Verificar cada subconjunto leva O(k²), mas isso é desprezível
+            self._tick()
+            # Verificar cada subconjunto leva O(k), mas isso é desprezível
             # frente ao custo de gerar 2ⁿ subconjuntos.
-            if BruteForceClique._is_clique(graph, candidate_set):
-                return candidate_set
+            if BruteForceClique._is_clique(graph, combination):
+                return sum(1 << v for v in combination)
         return None
 
-    def run(self) -> Set[int]:
-        vertices = list(self.graph.keys())
-        n = len(vertices)
+    def _batch_brute_force_clique(self, graph: CompactGraph) -> int:
+        n = len(graph)
+        if n > 63:
+            raise ValueError("O modo batch suporta no máximo 63 vértices.")
+        masks = graph.masks
+        full = (1 << n) - 1
+
+        # Cada máscara é dividida em parte baixa (L bits) e parte alta.
+        # Um lote = todas as 2^L partes baixas com uma parte alta fixa, e o
+        # teste do lote inteiro é vetorizado sobre o array das partes baixas.
+        low_bits = min(n, _LOW_BITS)
+        low_full = (1 << low_bits) - 1
+        lows = np.arange(1 << low_bits, dtype=np.uint64)
+        # Não-vizinhos de cada vértice (exceto ele mesmo) dentro da parte baixa.
+        non_adjacent_low = [np.uint64(low_full & ~masks[v] & ~(1 << v)) for v in range(n)]
+
+        # Parte do teste que não depende da parte alta: pares dentro da parte
+        # baixa. Calculado uma única vez para as 2^L máscaras.
+        one = np.uint64(1)
+        low_is_clique = np.ones(len(lows), dtype=bool)
+        for v in range(low_bits):
+            member = ((lows >> np.uint64(v)) & one).astype(bool)
+            low_is_clique &= ~member | ((lows & non_adjacent_low[v]) == 0)
+        low_sizes = popcount_array(lows)
+
+        best_mask, best_size = 0, 0
+        # Ainda são 2ⁿ subconjuntos testados, mas cada lote custa só
+        # |parte alta| operações vetorizadas em vez de O(k²) por subconjunto.
+        for high in range((full >> low_bits) + 1):
+            # Um lote = 2^L máscaras: o orçamento é conferido a cada lote.
+            self._check_budget()
+            high_mask = high << low_bits
+            # Pares dentro da parte alta são comuns a todo o lote: se a parte
+            # alta não é clique, nenhum subconjunto do lote é.
+            if not graph.is_clique(high_mask):
+                continue
+            is_clique = low_is_clique.copy()
+            for v in iter_bits(high_mask):
+                is_clique &= (lows & non_adjacent_low[v]) == 0
+            sizes = np.where(is_clique, low_sizes, -1)
+            i = int(np.argmax(sizes))
+            total = int(sizes[i]) + high.bit_count()
+            if total > best_size:
+                best_mask, best_size = high_mask | i, total
+                self._improve_labels(graph.to_labels(best_mask))
+        return best_mask
+
+    def _solve(self) -> CliqueResult:
+        if self.mode == "batch":
+            # O lote enumera o espaço de índices inteiro, então visões
+            # induzidas são reindexadas para 0..k-1.
+            graph = self.compact.compressed()
+            clique = graph.to_labels(self._batch_brute_force_clique(graph))
+            return CliqueResult(clique, upper_bound=len(clique), optimal=True)
+
+        n = len(self.compact)
         # Este loop percorre todos os tamanhos k = n, n-1, ..., 1.
         # Para cada k, geramos C(n, k) subconjuntos.
         #
@@ -56,7 +128,8 @@ class BruteForceClique(CliqueAlgorithm):
         # Logo, mesmo que interrompa cedo em alguns casos,
         # o pior caso continua sendo O(2ⁿ).
         for size in range(n, 0, -1):
-            clique = BruteForceClique._brute_force_clique(self.graph, size)
+            clique = self._brute_force_clique(self.compact, size)
             if clique is not None:
-                return clique
-        return set()
+                # Nenhum subconjunto maior é clique: a clique é máxima.
+                return CliqueResult(self.compact.to_labels(clique), upper_bound=size, optimal=True)
+        return CliqueResult(set(), upper_bound=0, optimal=True)
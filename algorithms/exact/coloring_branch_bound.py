@@ -0,0 +1,132 @@
+from typing import List, Tuple
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike
+
+
+class ColoringBranchBoundClique(CliqueAlgorithm):
+    """
+    Branch-and-bound com limite por coloração (família MCQ/MCR/MCS de Tomita).
+
+    Em cada nó os candidatos são coloridos gulosamente (coloração sequencial)
+    e ordenados por cor; o número de cores é um limite superior para a maior
+    clique dentro dos candidatos. Com ``renumber=True`` aplica o Re-NUMBER do
+    MCS, que tenta reduzir a cor de vértices com cor alta antes de aceitá-la.
+    """
+
+    def __init__(self, graph: GraphLike, renumber: bool = True):
+        super().__init__(graph)
+        self.renumber = renumber
+        self.masks = self.compact.masks
+        # Ordem inicial por grau decrescente (como no MCQ): vértices de grau
+        # alto entram primeiro na coloração e tendem a receber cores baixas.
+        degrees = self.compact.degrees()
+        self.vertices = sorted(self.compact.vertex_indices(), key=lambda x: degrees[x], reverse=True)
+        self.best_clique: List[int] = []
+        self.current_clique: List[int] = []
+        # Número de nós da árvore de busca (útil para comparar com backtracking)
+        self.nodes = 0
+
+    def _solve(self) -> CliqueResult:
+        if self.vertices:
+            order, colors = self._color_sort(self.vertices)
+            self._expand(order, colors)
+        # Busca completa: a melhor clique encontrada é a máxima.
+        size = len(self.best_clique)
+        return CliqueResult({self.compact.labels[v] for v in self.best_clique}, upper_bound=size, optimal=True)
+
+    # ----------------------------------------------------
+    # Busca
+    # ----------------------------------------------------
+    def _expand(self, candidates: List[int], colors: List[int]):
+        self._tick()
+        self.nodes += 1
+        masks = self.masks
+
+        # Percorremos do fim para o começo: os últimos candidatos têm as
+        # maiores cores, então o limite len(atual) + cor cai a cada passo.
+        for idx in range(len(candidates) - 1, -1, -1):
+            # PODA: mesmo usando uma clique de cada classe de cor restante,
+            # não superamos a melhor clique. Como as cores são crescentes,
+            # todos os candidatos anteriores também são podados.
+            if len(self.current_clique) + colors[idx] <= len(self.best_clique):
+                return
+
+            v = candidates[idx]
+            self.current_clique.append(v)
+
+            # Novos candidatos: vizinhos de v entre os candidatos anteriores.
+            # Teste de adjacência é um shift + AND no bitset de v.
+            neighborhood = masks[v]
+            new_candidates = [w for w in candidates[:idx] if (neighborhood >> w) & 1]
+
+            if new_candidates:
+                # Recoloração a cada nó: o limite é recalculado para o subproblema.
+                order, new_colors = self._color_sort(new_candidates)
+                self._expand(order, new_colors)
+            elif len(self.current_clique) > len(self.best_clique):
+                self.best_clique = list(self.current_clique)
+                self._improve(self.best_clique)
+
+            self.current_clique.pop()
+
+    # ----------------------------------------------------
+    # Coloração sequencial (NUMBER-SORT / Re-NUMBER)
+    # ----------------------------------------------------
+    def _color_sort(self, candidates: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Colore ``candidates`` na ordem dada e devolve (vértices, cores) em
+        ordem crescente de cor. Cada classe de cor é um bitset, então testar
+        se v cabe numa classe é um único AND.
+        """
+        masks = self.masks
+        # Só vértices com cor >= k_min podem gerar ramos que superem a melhor
+        # clique; os demais são mantidos com cor 0 (nunca serão expandidos).
+        k_min = max(len(self.best_clique) - len(self.current_clique) + 1, 1)
+
+        classes: List[int] = []
+        members: List[List[int]] = []
+        for v in candidates:
+            nv = masks[v]
+            k = 0
+            while k < len(classes) and classes[k] & nv:
+                k += 1
+
+            if k == len(classes) and self.renumber and k + 1 >= k_min and k >= 2:
+                # Re-NUMBER: abrir uma nova classe aumenta o limite. Tentamos
+                # achar uma classe k1 onde v tem um único vizinho w que possa
+                # migrar para outra classe k2 > k1 sem conflitos.
+                if self._renumber(v, nv, classes, members, min(k, k_min - 1)):
+                    continue
+
+            if k == len(classes):
+                classes.append(0)
+                members.append([])
+            classes[k] |= 1 << v
+            members[k].append(v)
+
+        order: List[int] = []
+        colors: List[int] = []
+        for k, group in enumerate(members):
+            color = k + 1
+            for v in group:
+                order.append(v)
+                colors.append(color if color >= k_min else 0)
+        return order, colors
+
+    def _renumber(self, v: int, nv: int, classes: List[int], members: List[List[int]], limit: int) -> bool:
+        masks = self.masks
+        for k1 in range(limit):
+            conflicts = classes[k1] & nv
+            if conflicts.bit_count() != 1:
+                continue
+            w = conflicts.bit_length() - 1
+            nw = masks[w]
+            for k2 in range(k1 + 1, limit):
+                if classes[k2] & nw == 0:
+                    # w migra de k1 para k2 e v ocupa o lugar de w em k1
+                    classes[k1] ^= (1 << w) | (1 << v)
+                    members[k1].remove(w)
+                    members[k1].append(v)
+                    classes[k2] |= 1 << w
+                    members[k2].append(w)
+                    return True
+        return False
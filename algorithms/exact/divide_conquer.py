@@ -1,68 +1,139 @@
-from typing import Set, List, Dict
-from algorithms.base import CliqueAlgorithm
-from algorithms.exact.brute_force import BruteForceClique
-from algorithms.exact.backtracking import BacktrackingClique
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+from algorithms.exact.bitboard_branch_bound import BitParallelClique
+from algorithms.ordering import degeneracy_ordering
+
+# Estado de cada processo trabalhador, definido pelo initializer do pool:
+# o grafo é enviado uma única vez por processo e o tamanho da melhor clique
+# conhecida é compartilhado entre todos (multiprocessing.Value).
+_WORKER_GRAPH: Optional[CompactGraph] = None
+_WORKER_INCUMBENT = None
+_WORKER_BUDGET: Optional[Budget] = None
+
+
+def _init_worker(graph: CompactGraph, incumbent, budget: Optional[Budget]):
+    global _WORKER_GRAPH, _WORKER_INCUMBENT, _WORKER_BUDGET
+    _WORKER_GRAPH = graph
+    _WORKER_INCUMBENT = incumbent
+    _WORKER_BUDGET = budget
+
+
+def _solve_subproblems(tasks: List[Tuple[int, int]]) -> Tuple[int, int, bool]:
+    return DivideConquerClique._solve_subproblems(_WORKER_GRAPH, _WORKER_INCUMBENT, tasks, _WORKER_BUDGET)
+
 
 class DivideConquerClique(CliqueAlgorithm):
-    """Classe para abordagem divisão e conquista (componentes conexos)."""
-    def __init__(self, graph: Dict[int, Set[int]]):
+    """
+    Divisão e conquista por vértice, com subproblemas resolvidos em paralelo.
+
+    Divisão: os vértices são ordenados por degenerescência e cada vértice v
+    gera o subproblema "v + vizinhos posteriores a v". Toda clique aparece inteira no subproblema do seu
+    primeiro vértice, e nenhum subproblema tem mais que degenerescência + 1
+    vértices.
+
+    Conquista: cada subproblema é resolvido pelo BitParallelClique sobre uma
+    visão induzida. Os subproblemas vão todos para o mesmo
+    ProcessPoolExecutor, e um tamanho de incumbente compartilhado permite
+    descartar subproblemas pequenos demais para superá-lo.
+    """
+
+    # Abaixo deste tamanho o custo de criar processos domina: resolve localmente.
+    PARALLEL_MIN_VERTICES = 64
+
+    def __init__(self, graph: GraphLike, max_workers: Optional[int] = None):
         super().__init__(graph)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _solve(self) -> CliqueResult:
+        if not len(self.compact):
+            return CliqueResult(set(), upper_bound=0, optimal=True)
+        # Divisão por vértice: n subproblemas de tamanho <= degenerescência + 1,
+        # que para grafos esparsos é muito menor que n. Esta etapa custa
+        # O(n + m) e NÃO afeta a complexidade exponencial.
+        tasks = self._vertex_subproblems()
+        # Subproblemas maiores primeiro: tendem a achar cliques grandes cedo,
+        # o que aumenta o incumbente e descarta mais subproblemas depois.
+        tasks.sort(key=lambda task: task[1].bit_count(), reverse=True)
+
+        if self.max_workers <= 1 or len(self.compact) < self.PARALLEL_MIN_VERTICES:
+            _, best, interrupted = self._solve_subproblems(self.compact, None, tasks, self.budget, self._improve)
+        else:
+            best, interrupted = self._solve_parallel(tasks)
+        if interrupted:
+            self._improve(best)
+            raise SearchInterrupted()
+        # Todos os subproblemas foram resolvidos ou descartados pelo limite.
+        return CliqueResult(self.compact.to_labels(best), upper_bound=best.bit_count(), optimal=True)
+
+    def _solve_parallel(self, tasks: List[Tuple[int, int]]) -> Tuple[int, bool]:
+        incumbent = multiprocessing.Value("i", 0)
+        # Lotes intercalados (i, i + k, i + 2k, ...) mantêm em cada lote uma
+        # mistura de subproblemas grandes e pequenos.
+        num_batches = min(len(tasks), self.max_workers * 4)
+        batches = [tasks[i::num_batches] for i in range(num_batches)]
+
+        best_size, best, interrupted = 0, 0, False
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.compact, incumbent, self.budget),
+        ) as executor:
+            for size, clique, timed_out in executor.map(_solve_subproblems, batches):
+                interrupted = interrupted or timed_out
+                if size > best_size:
+                    best_size, best = size, clique
+                    self._improve(best)
+        return best, interrupted
+
+    @staticmethod
+    def _solve_subproblems(
+        graph: CompactGraph,
+        incumbent,
+        tasks: List[Tuple[int, int]],
+        budget: Optional[Budget] = None,
+        report: Optional[Callable[[int], None]] = None,
+    ) -> Tuple[int, int, bool]:
+        # Devolve (tamanho, clique, interrompido). Com orçamento, cada
+        # subproblema roda sob o mesmo Budget e uma interrupção encerra o lote.
+        best_size, best = 0, 0
+        for vertex, later in tasks:
+            if budget is not None and budget.expired():
+                return best_size, best, True
+            shared = incumbent.value if incumbent is not None else 0
+            bound = max(best_size, shared)
+            # O subproblema não pode superar o incumbente: pulamos sem resolver.
+            if 1 + later.bit_count() <= bound:
+                continue
+            # Procuramos apenas cliques de tamanho > bound - 1 entre os vizinhos.
+            solver = BitParallelClique(graph.induced(later), lower_bound=max(bound - 1, 0))
+            sub = solver.run(budget=budget)
+            size = 1 + len(sub)
+            if size > bound:
+                best_size, best = size, graph.to_mask(sub) | (1 << vertex)
+                if report is not None:
+                    report(best)
+                if incumbent is not None:
+                    with incumbent.get_lock():
+                        if size > incumbent.value:
+                            incumbent.value = size
+            if solver.timed_out:
+                return best_size, best, True
+        return best_size, best, False
 
-    def run(self) -> Set[int]:
-        if not self.graph:
-            return set()
-        # Dividimos o grafo em componentes conexos.
-        # Esta etapa custa no máximo O(n + m) e NÃO afeta a complexidade exponencial.
-        components = self._connected_components()
-        max_clique: Set[int] = set()
-         # A divisão em componentes reduz o problema SOMENTE
-        # quando o grafo tem partes realmente separadas.
-        # Mas no pior caso, o grafo inteiro é um ÚNICO componente conexo.
-        #
-        # Nesse pior caso, "components" tem exatamente 1 conjunto de n vértices
-        # → nenhuma divisão ocorre
-        for comp in components:
-            sub = self._induced_subgraph(comp)
-             # A divisão em componentes reduz o problema SOMENTE
-            # quando o grafo tem partes realmente separadas.
-            # Mas no pior caso, o grafo inteiro é um ÚNICO componente conexo.
-            #
-            # Nesse pior caso, "components" tem exatamente 1 conjunto de n vértices
-            # → nenhuma divisão ocorre
-
-            if len(comp) <= 20:
-                solver = BruteForceClique(sub)
-            else:
-                solver = BacktrackingClique(sub)
-            # Aqui o solver é executado.
-            # No pior caso, BacktrackingClique(sub) = O(2^n).
-            comp_clique = solver.run()
-            if len(comp_clique) > len(max_clique):
-                max_clique = comp_clique
-        return max_clique
-
-    def _connected_components(self) -> List[Set[int]]:
-    # DFS iterativo para componentes.    
-    # Complexidade O(n + m).
-    # Isso é polinomial e NÃO altera a complexidade exponencial.
-        visited = set()
-        components: List[Set[int]] = []
-        for vertex in self.graph:
-            if vertex not in visited:
-                comp = set()
-                stack = [vertex]
-                while stack:
-                    cur = stack.pop()
-                    if cur not in visited:
-                        visited.add(cur)
-                        comp.add(cur)
-                        for neigh in self.graph[cur]:
-                            if neigh not in visited:
-                                stack.append(neigh)
-                components.append(comp)
-        return components
-
-    def _induced_subgraph(self, vertices: Set[int]) -> Dict[int, Set[int]]:
-        # Criar subgrafo induzido é O(n²) no pior caso,
-        # mas isso continua sendo irrelevante frente ao solver O(2^n).
-        return {v: self.graph[v].intersection(vertices) for v in vertices}
+    def _vertex_subproblems(self) -> List[Tuple[int, int]]:
+        # Para cada vértice, o subproblema é ele + seus vizinhos que aparecem
+        # depois dele na ordem de degenerescência (Batagelj–Zaversnik, O(n + m)).
+        # Vizinhos nunca cruzam componentes, então a ordem global já separa
+        # os componentes conexos sem precisar encontrá-los explicitamente.
+        masks = self.compact.masks
+        remaining = self.compact.vertices
+        tasks: List[Tuple[int, int]] = []
+        for v in degeneracy_ordering(self.compact):
+            remaining &= ~(1 << v)
+            tasks.append((v, masks[v] & remaining))
+        return tasks
@@ -1,39 +1,60 @@
-from typing import Dict, Set
-from algorithms.base import CliqueAlgorithm
+from typing import List, Set
+import numpy as np
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike
+from algorithms.compact_graph import CompactGraph
+
+# Tamanho dos blocos processados por vez nos modos NumPy: limita os
+# temporários (arange, comparações) independentemente de 2^n.
+_CHUNK = 1 << 16
 
 
 class DPCliqueBitmask(CliqueAlgorithm):
     """
     Programação dinâmica com bitmask para encontrar a clique máxima.
-    Viável apenas para grafos pequenos (<= 20-22 vértices).
+
+    Modos:
+      - "classic": DP original com duas listas Python de 2^n objetos.
+        Viável apenas para grafos pequenos (<= 20-22 vértices).
+      - "compact": mesma tabela, mas com um byte por máscara (uint8) e
+        preenchida camada a camada com NumPy. Cerca de 2^n bytes (~30 vértices).
+      - "split": meet-in-the-middle. Cada metade tem sua tabela de 2^(n/2)
+        bytes e as metades são combinadas pelas máscaras de adjacência entre
+        elas, chegando a 40+ vértices em memória limitada.
     """
 
-    def run(self) -> Set[int]:
-        return self._dp_clique_bitmask(self.graph)
+    MODES = ("classic", "compact", "split")
+
+    def __init__(self, graph: GraphLike, mode: str = "classic"):
+        super().__init__(graph)
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de DP desconhecido: {mode}")
+        self.mode = mode
+
+    def _solve(self) -> CliqueResult:
+        # O DP enumera o espaço de índices inteiro, então visões induzidas
+        # são reindexadas para 0..k-1 antes de começar.
+        graph = self.compact.compressed()
+        if self.mode == "compact":
+            clique = self._dp_clique_compact(graph)
+        elif self.mode == "split":
+            clique = self._dp_clique_split(graph)
+        else:
+            clique = self._dp_clique_bitmask(graph)
+        # Todos os modos examinam todas as máscaras: a clique é máxima.
+        return CliqueResult(clique, upper_bound=len(clique), optimal=True)
 
     # ----------------------------------------------------
     # Implementação interna do DP
     # ----------------------------------------------------
-    def _dp_clique_bitmask(self, graph: Dict[int, Set[int]]) -> Set[int]:
-        vertices = list(graph.keys())
-        n = len(vertices)
+    def _dp_clique_bitmask(self, graph: CompactGraph) -> Set[int]:
+        n = len(graph)
 
         if n == 0:
             return set()
 
-        # Mapear vértice -> índice
-        vertex_to_index = {v: i for i, v in enumerate(vertices)}
-
-        # Precomputar adjacências como bitmasks é O(n^2),
-        # o que é polinomial e irrelevante para o custo exponencial principal.
-        adj_masks = [0] * n
-        for i, v in enumerate(vertices):
-            mask = 0
-            for neighbor in graph[v]:
-                if neighbor in vertex_to_index:
-                    j = vertex_to_index[neighbor]
-                    mask |= (1 << j)
-            adj_masks[i] = mask
+        # As adjacências já vêm como bitmasks do CompactGraph (índices 0..n-1),
+        # então não há mais o pré-processamento O(n^2) de montar as máscaras.
+        adj_masks = graph.masks
         # DP tem tamanho 2^n — este é o ponto crítico.
         #
         # dp[mask] indica se mask é clique.
@@ -53,7 +74,7 @@ class DPCliqueBitmask(CliqueAlgorithm):
             clique_size[1 << i] = 1
 
         max_mask = 0
-        max_size = 1
+        max_size = 0
 
         # -------------------------------------------------
         # Loop PRINCIPAL do DP
@@ -64,6 +85,7 @@ class DPCliqueBitmask(CliqueAlgorithm):
         # Em cada máscara válida, tentamos expandi-la,
         # o que mantém a explosão combinatória inevitavelmente.
         for mask in range(1 << n):
+            self._tick()
             if not dp[mask]:
                 continue
 
@@ -72,6 +94,7 @@ class DPCliqueBitmask(CliqueAlgorithm):
             if current_size > max_size:
                 max_size = current_size
                 max_mask = mask
+                self._improve_labels(graph.to_labels(max_mask))
 
             # Tentar adicionar um novo vértice i à máscara atual.
             #
@@ -90,9 +113,104 @@ class DPCliqueBitmask(CliqueAlgorithm):
                     clique_size[new_mask] = current_size + 1
 
         #Reconstruir clique final é O(n)
-        result = set()
-        for i in range(n):
-            if max_mask & (1 << i):
-                result.add(vertices[i])
+        return graph.to_labels(max_mask)
+
+    # ----------------------------------------------------
+    # Modos NumPy: um byte por máscara
+    # ----------------------------------------------------
+    def _clique_sizes(self, adj_masks: List[int], k: int) -> np.ndarray:
+        """
+        sizes[mask] = |mask| se mask é clique, senão 0 (sizes[0] = 0).
+
+        Preenchido por camadas: as máscaras em [2^b, 2^(b+1)) são
+        "rest + vértice b", e rest < 2^b já foi calculado. Cada camada é uma
+        operação vetorizada sobre blocos de _CHUNK máscaras.
+        """
+        sizes = np.zeros(1 << k, dtype=np.uint8)
+        for b in range(k):
+            low = 1 << b
+            # Vértices anteriores a b que NÃO são vizinhos de b.
+            forbidden = np.uint64(~adj_masks[b] & (low - 1))
+            for start in range(0, low, _CHUNK):
+                # Orçamento conferido uma vez por bloco de _CHUNK máscaras.
+                self._check_budget()
+                stop = min(low, start + _CHUNK)
+                rest = np.arange(start, stop, dtype=np.uint64)
+                prev = sizes[start:stop]
+                ok = ((rest & forbidden) == 0) & ((prev > 0) | (rest == 0))
+                sizes[low + start:low + stop] = np.where(ok, prev + 1, 0)
+        return sizes
+
+    def _dp_clique_compact(self, graph: CompactGraph) -> Set[int]:
+        n = len(graph)
+        if n == 0:
+            return set()
+        # Uma única tabela uint8 de 2^n entradas substitui as duas listas
+        # de objetos Python do modo clássico (~1/16 da memória).
+        sizes = self._clique_sizes(list(graph.masks), n)
+        return graph.to_labels(int(np.argmax(sizes)))
+
+    def _dp_clique_split(self, graph: CompactGraph) -> Set[int]:
+        n = len(graph)
+        if n == 0:
+            return set()
 
-        return result
+        # Metade A = vértices 0..h-1, metade B = h..n-1.
+        h = n // 2
+        nb = n - h
+        mask_a, mask_b = (1 << h) - 1, (1 << nb) - 1
+        masks = graph.masks
+        adj_a = [masks[i] & mask_a for i in range(h)]
+        adj_b = [(masks[h + j] >> h) & mask_b for j in range(nb)]
+        # Vizinhos em B de cada vértice de A (máscaras de adjacência cruzadas).
+        cross = [(masks[i] >> h) & mask_b for i in range(h)]
+
+        # best_b[S] = maior clique contida em S ⊆ B. Começa com o tamanho
+        # das cliques e propaga o máximo para superconjuntos (SOS DP), um bit
+        # por vez, com reshape em vez de laços Python.
+        sizes_b = self._clique_sizes(adj_b, nb)
+        best_b = sizes_b.copy()
+        for b in range(nb):
+            view = best_b.reshape(-1, 2, 1 << b)
+            np.maximum(view[:, 1, :], view[:, 0, :], out=view[:, 1, :])
+
+        # common[S] = vizinhos comuns em B de uma clique S ⊆ A, pela mesma
+        # recorrência em camadas: common[rest + b] = common[rest] & cross[b].
+        dtype = np.uint32 if nb <= 32 else np.uint64
+        sizes_a = self._clique_sizes(adj_a, h)
+        common = np.empty(1 << h, dtype=dtype)
+        common[0] = mask_b
+        for b in range(h):
+            low = 1 << b
+            for start in range(0, low, _CHUNK):
+                self._check_budget()
+                stop = min(low, start + _CHUNK)
+                common[low + start:low + stop] = common[start:stop] & dtype(cross[b])
+
+        # Combinação: |S| + best_b[common[S]] para toda clique S de A.
+        best_total, best_a = -1, 0
+        for start in range(0, 1 << h, _CHUNK):
+            self._check_budget()
+            stop = min(1 << h, start + _CHUNK)
+            size = sizes_a[start:stop].astype(np.int16)
+            total = size + best_b[common[start:stop]]
+            valid = (size > 0) | (np.arange(start, stop) == 0)
+            total = np.where(valid, total, -1)
+            i = int(np.argmax(total))
+            if total[i] > best_total:
+                best_total, best_a = int(total[i]), start + i
+
+        # Reconstrução da parte B: descemos de common[best_a] removendo bits
+        # que não reduzem best_b até sobrar exatamente uma clique ótima.
+        target = int(best_b[common[best_a]])
+        part_b = int(common[best_a])
+        while sizes_b[part_b] != target:
+            rest = part_b
+            while rest:
+                bit = rest & -rest
+                if best_b[part_b ^ bit] == target:
+                    part_b ^= bit
+                    break
+                rest ^= bit
+
+        return graph.to_labels(best_a | (part_b << h))
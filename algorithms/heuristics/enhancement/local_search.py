@@ -1,91 +1,127 @@
-from typing import Set, Dict
-from algorithms.base import CliqueAlgorithm
+import random
+from typing import Dict, List, Optional, Set
+from algorithms.base import CliqueAlgorithm, GraphLike
 from algorithms import GreedyCliqueWithRestarts
+from algorithms.heuristics.enhancement.tightness import TightnessState
 
 
 class LocalSearchClique(CliqueAlgorithm):
     """
-    Implementação da busca local para clique máxima,
-    exatamente baseada na função que você forneceu.
+    Busca local para clique máxima no estilo ARW (Andrade, Resende e Werneck).
+
+    A clique corrente é mantida por um ``TightnessState``: para cada vértice
+    de fora sabemos quantos membros da clique lhe faltam, e os conjuntos
+    0-missing e 1-missing saem direto dos buckets. A cada iteração, em ordem
+    de preferência:
+      1) adição de um vértice 0-missing;
+      2) (1,2)-swap: sai um membro v, entram dois vértices adjacentes cujo
+         único membro faltante é v;
+      3) platô (1,1)-swap com lista tabu: o membro que sai não pode voltar
+         por ``tabu_tenure`` iterações;
+      4) perturbação: um vértice aleatório entra e seus não vizinhos saem.
+    Cada movimento custa O(grau) para atualizar os contadores.
     """
 
-    def __init__(self, graph: Dict[int, Set[int]], max_iterations: int = 1000):
+    def __init__(
+        self,
+        graph: GraphLike,
+        max_iterations: int = 1000,
+        tabu_tenure: int = 7,
+        seed: Optional[int] = None,
+    ):
         super().__init__(graph)
         self.max_iterations = max_iterations
+        self.tabu_tenure = tabu_tenure
+        self.seed = seed
 
     # ----- Funções auxiliares -----
 
     @staticmethod
-    def is_clique(graph, vertices: Set[int]) -> bool:
-        for v in vertices:
-            for u in vertices:
-                if v != u and u not in graph[v]:
-                    return False
-        return True
-
-    def local_search(self, initial_clique: Set[int]) -> Set[int]:
-        graph = self.graph
-        current = set(initial_clique)
-        best = set(initial_clique)
-        vertices = set(graph.keys())
-
-        for _ in range(self.max_iterations):
-            improved = False
+    def _two_improvement(state: TightnessState) -> bool:
+        # Agrupa os vértices 1-missing pelo membro que lhes falta:
+        # O(grau(x) + |C|) por vértice.
+        groups: Dict[int, List[int]] = {}
+        for x in state.one_missing():
+            groups.setdefault(state.missing_neighbor(x), []).append(x)
+
+        # Dois vértices do mesmo grupo e adjacentes entre si substituem o
+        # membro comum: a clique cresce 1.
+        for v, group in groups.items():
+            for i, x in enumerate(group):
+                state.mark_neighbors(x)
+                for y in group[i + 1:]:
+                    if state.is_marked(y):
+                        state.drop(v)
+                        state.add(x)
+                        state.add(y)
+                        return True
+        return False
 
+    @staticmethod
+    def _perturb(state: TightnessState, vertex: int) -> List[int]:
+        # Força a entrada de vertex removendo os membros não adjacentes.
+        state.mark_neighbors(vertex)
+        dropped = [u for u in state.clique if not state.is_marked(u)]
+        for u in dropped:
+            state.drop(u)
+        state.add(vertex)
+        return dropped
+
+    def local_search(self, initial_clique: List[int]) -> List[int]:
+        state = TightnessState(self.compact, initial_clique)
+        if not state.vertices:
+            return []
+        rng = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+        best = list(state.clique)
+        # tabu[v] = última iteração em que v ainda não pode voltar à clique.
+        tabu = [0] * self.compact.n
+
+        for it in range(1, self.max_iterations + 1):
+            self._check_budget()
             # ------------ 1) Adição de vértice ------------
-            candidates = vertices - current
-            for v in candidates:
-                if all(v in graph[u] for u in current):
-                    current.add(v)
-                    improved = True
-                    break
-
-            if improved:
-                if len(current) > len(best):
-                    best = set(current)
-                continue
-
-            # ------------ 2) Swap: troca 2 -> 2 ------------
-            if len(current) >= 2:
-                for v1 in current:
-                    for v2 in current:
-                        if v1 >= v2:
-                            continue
-
-                        swap_candidates = set()
-                        for cand in candidates:
-                            ok = True
-                            for v in current:
-                                if v not in {v1, v2} and cand not in graph[v]:
-                                    ok = False
-                                    break
-                            if ok:
-                                swap_candidates.add(cand)
-
-                        if len(swap_candidates) >= 2:
-                            new_clique = (current - {v1, v2}).union(
-                                list(swap_candidates)[:2]
-                            )
-                            if self.is_clique(graph, new_clique) and len(new_clique) > len(current):
-                                current = new_clique
-                                improved = True
-                                break
-
-                    if improved:
-                        break
-
-            if not improved:
-                break
+            free = state.free()
+            if free:
+                state.add(free[rng.randrange(len(free))])
+
+            # ------------ 2) (1,2)-swap ------------
+            elif not self._two_improvement(state):
+
+                # ------------ 3) Platô: (1,1)-swap com tabu ------------
+                allowed = [x for x in state.one_missing() if tabu[x] < it]
+                if allowed:
+                    x = allowed[rng.randrange(len(allowed))]
+                    v = state.missing_neighbor(x)
+                    state.swap(v, x)
+                    tabu[v] = it + self.tabu_tenure
+
+                # ------------ 4) Perturbação ------------
+                else:
+                    outside = [v for v in state.vertices if not state.in_clique[v] and tabu[v] < it]
+                    if not outside:
+                        continue
+                    for u in self._perturb(state, outside[rng.randrange(len(outside))]):
+                        tabu[u] = it + self.tabu_tenure
+
+            if state.size > len(best):
+                best = list(state.clique)
+                self._improve(best)
 
         return best
 
     # ----- Método principal -----
 
-    def run(self) -> Set[int]:
+    def _solve(self) -> Set[int]:
         # Fase 1: solução inicial via greedy com restarts
-        initial = GreedyCliqueWithRestarts(self.graph, num_restarts=10).run()
+        # (o CompactGraph é repassado sem nova normalização)
+        initial = self._run_inner(GreedyCliqueWithRestarts(self.compact, num_restarts=10, seed=self.seed))
+        index = self.compact.index
+        seed_clique = [index[v] for v in initial]
+        # A clique inicial já é o incumbente: se o orçamento acabar antes da
+        # primeira melhora da busca local, ela é a resposta.
+        self._improve(seed_clique)
 
         # Fase 2: busca local
-        best = self.local_search(initial)
+        best = self.local_search(seed_clique)
 
-        return best
+        labels = self.compact.labels
+        return {labels[v] for v in best}
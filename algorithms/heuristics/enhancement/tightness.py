@@ -0,0 +1,146 @@
+from typing import Iterable, List, Optional
+from algorithms.compact_graph import CompactGraph
+
+
+class TightnessState:
+    """
+    Clique corrente + contadores de "tightness" (Andrade–Resende–Werneck).
+
+    Para todo vértice x, ``tight[x] = |N(x) ∩ C|``. Um vértice fora da
+    clique com ``tight == |C|`` é 0-missing (pode ser adicionado) e com
+    ``tight == |C| - 1`` é 1-missing (entra trocando-se por um único
+    membro). Os vértices fora da clique ficam em buckets indexados pela
+    tightness, então os dois conjuntos são ``bucket(|C|)`` e
+    ``bucket(|C| - 1)``, sem varrer o grafo.
+
+    Adicionar ou remover v custa O(grau(v)): só os vizinhos de v mudam
+    de tightness (e de bucket, por troca com o último elemento).
+    """
+
+    def __init__(self, graph: CompactGraph, clique: Iterable[int] = ()):
+        self.graph = graph
+        self._indptr = graph.indptr.tolist()
+        self._indices = graph.indices.tolist()
+        n = graph.n
+        self.vertices = graph.vertex_indices()
+        self.tight = [0] * n
+        self.in_clique = [False] * n
+        self.clique: List[int] = []
+        self._clique_pos = [0] * n
+        # Buckets como arrays: _bucket_pos[x] é a posição de x no seu bucket.
+        max_degree = max((self.degree(v) for v in self.vertices), default=0)
+        self._buckets: List[List[int]] = [[] for _ in range(max_degree + 2)]
+        self._bucket_pos = [0] * n
+        for v in self.vertices:
+            self._bucket_insert(v)
+        # Carimbos para testes de adjacência em O(grau) sem limpar arrays.
+        self._stamp = [0] * n
+        self._stamp_id = 0
+        for v in clique:
+            self.add(v)
+
+    # ----------------------------------------------------
+    # Consultas
+    # ----------------------------------------------------
+    @property
+    def size(self) -> int:
+        return len(self.clique)
+
+    def degree(self, v: int) -> int:
+        return self._indptr[v + 1] - self._indptr[v]
+
+    def neighbors(self, v: int) -> List[int]:
+        return self._indices[self._indptr[v]:self._indptr[v + 1]]
+
+    def bucket(self, tightness: int) -> List[int]:
+        """Vértices fora da clique com a tightness dada (não modificar)."""
+        if 0 <= tightness < len(self._buckets):
+            return self._buckets[tightness]
+        return []
+
+    def free(self) -> List[int]:
+        """Vértices 0-missing: adjacentes a toda a clique."""
+        return self.bucket(self.size)
+
+    def one_missing(self) -> List[int]:
+        """Vértices 1-missing: não adjacentes a exatamente um membro."""
+        return self.bucket(self.size - 1)
+
+    def mark_neighbors(self, v: int) -> List[int]:
+        """Carimba N(v); ``is_marked(u)`` vale até a próxima marcação."""
+        self._stamp_id += 1
+        stamp, sid = self._stamp, self._stamp_id
+        for u in self.neighbors(v):
+            stamp[u] = sid
+        return stamp
+
+    def is_marked(self, u: int) -> bool:
+        return self._stamp[u] == self._stamp_id
+
+    def missing_neighbor(self, x: int) -> Optional[int]:
+        """Primeiro membro da clique não adjacente a x: O(grau(x) + |C|)."""
+        self.mark_neighbors(x)
+        for u in self.clique:
+            if not self.is_marked(u):
+                return u
+        return None
+
+    # ----------------------------------------------------
+    # Movimentos
+    # ----------------------------------------------------
+    def add(self, v: int):
+        self._bucket_remove(v)
+        self.in_clique[v] = True
+        self._clique_pos[v] = len(self.clique)
+        self.clique.append(v)
+        self._shift_neighbors(v, 1)
+
+    def drop(self, v: int):
+        # Remoção O(1) da lista da clique: troca com o último membro.
+        pos, last = self._clique_pos[v], self.clique[-1]
+        self.clique[pos] = last
+        self._clique_pos[last] = pos
+        self.clique.pop()
+        self.in_clique[v] = False
+        self._shift_neighbors(v, -1)
+        self._bucket_insert(v)
+
+    def swap(self, out: int, into: int):
+        """(1,1)-swap: troca o membro ``out`` pelo vértice 1-missing ``into``."""
+        self.drop(out)
+        self.add(into)
+
+    # ----------------------------------------------------
+    # Buckets
+    # ----------------------------------------------------
+    def _shift_neighbors(self, v: int, delta: int):
+        # Cada vizinho de fora troca do bucket t para t + delta. As trocas
+        # são feitas em linha (sem chamadas de método): é o laço mais quente
+        # das buscas locais, O(grau(v)) por movimento.
+        tight, in_clique = self.tight, self.in_clique
+        buckets, bucket_pos = self._buckets, self._bucket_pos
+        for u in self.neighbors(v):
+            t = tight[u]
+            tight[u] = t + delta
+            if in_clique[u]:
+                continue
+            bucket = buckets[t]
+            pos, last = bucket_pos[u], bucket[-1]
+            bucket[pos] = last
+            bucket_pos[last] = pos
+            bucket.pop()
+            bucket = buckets[t + delta]
+            bucket_pos[u] = len(bucket)
+            bucket.append(u)
+
+    def _bucket_insert(self, v: int):
+        bucket = self._buckets[self.tight[v]]
+        self._bucket_pos[v] = len(bucket)
+        bucket.append(v)
+
+    def _bucket_remove(self, v: int):
+        bucket = self._buckets[self.tight[v]]
+        pos, last = self._bucket_pos[v], bucket[-1]
+        bucket[pos] = last
+        self._bucket_pos[last] = pos
+        bucket.pop()
@@ -1,64 +1,101 @@
-from typing import Set, Dict
-from algorithms.base import CliqueAlgorithm
-import random
+from typing import List, Set
+import numpy as np
+from algorithms.base import CliqueAlgorithm, GraphLike
+from algorithms.compact_graph import POPCOUNT8
 
 
 class GreedyCliqueDegree(CliqueAlgorithm):
-    """Heurística gulosa baseada no vértice de maior grau."""
+    """
+    Heurística gulosa baseada no vértice de maior grau.
 
-    def run(self) -> Set[int]:
-        graph = self.graph
+    Modos:
+      - "incremental": mantém o grau de cada candidato dentro do conjunto de
+        candidatos e, quando o conjunto encolhe, atualiza apenas os contadores
+        afetados pelos vértices que saíram. O(n + m) de atualizações no total.
+      - "numpy": recalcula os graus de todos os candidatos de uma vez, com
+        uma soma por linha (popcount) sobre a matriz de adjacência empacotada
+        mascarada pelos candidatos.
+    """
 
-        if not graph:
-            return set()
+    MODES = ("incremental", "numpy")
+
+    def __init__(self, graph: GraphLike, mode: str = "incremental"):
+        super().__init__(graph)
+        if mode not in self.MODES:
+            raise ValueError(f"Modo guloso desconhecido: {mode}")
+        self.mode = mode
 
-        clique = set()
+    def _solve(self) -> Set[int]:
+        if not len(self.compact):
+            return set()
+        if self.mode == "numpy":
+            clique = self._numpy_clique()
+        else:
+            clique = self._incremental_clique()
+        labels = self.compact.labels
+        return {labels[v] for v in clique}
 
-        # Conjunto de candidatos começa com todos os vértices.
-        # O tamanho é n e vamos reduzir conforme escolhemos vértices.
-        candidates = set(graph.keys())
+    def _incremental_clique(self) -> List[int]:
+        graph = self.compact
+        indptr, indices = graph.indptr, graph.indices
+        n = graph.n
 
-        # Loop principal: a cada iteração escolhemos 1 vértice
-        # ou removemos 1 vértice de candidates.
-        #
-        # Portanto, o loop pode executar até n vezes.
-        while candidates:
-            best_vertex = None
-            best_degree = -1
+        # Candidatos em ordem crescente de índice (desempate pelo menor).
+        # degree[u] = |N(u) ∩ candidatos|, válido para todo candidato u.
+        candidates = np.array(graph.vertex_indices(), dtype=np.int64)
+        degree = np.diff(indptr).astype(np.int64)
+        clique: List[int] = []
 
-            # Escolher o melhor vértice exige percorrer todos os candidatos.
-            #
-            # Para cada vértice, precisamos calcular:
-            #   len(graph[vertex].intersection(candidates))
-            #
-            # intersection() é O(n) no pior caso,
-            # e fazemos isso para até n candidatos.
-            #
-            # Portanto, esta seleção é O(n²) no pior caso.
-            for vertex in candidates:
-                current_degree = len(graph[vertex].intersection(candidates))
-                if current_degree > best_degree:
-                    best_vertex = vertex
-                    best_degree = current_degree
+        # Loop principal: a cada iteração um vértice entra na clique e os
+        # candidatos viram candidatos ∩ vizinhos(escolhido). Como todo
+        # candidato restante é vizinho de toda a clique, o escolhido sempre
+        # pode entrar. O loop roda |clique| vezes.
+        while candidates.size:
+            # Escolher o melhor é um argmax O(|candidatos|) sobre contadores
+            # já atualizados: nenhuma interseção é recalculada.
+            best_vertex = int(candidates[np.argmax(degree[candidates])])
+            clique.append(best_vertex)
+            # Toda clique parcial é válida: reportamos e conferimos o orçamento.
+            self._improve(clique)
+            self._check_budget()
 
-            if best_vertex is None:
+            is_neighbor = np.zeros(n, dtype=bool)
+            is_neighbor[indices[indptr[best_vertex]:indptr[best_vertex + 1]]] = True
+            keep = is_neighbor[candidates]
+            leaving = candidates[~keep]
+            candidates = candidates[keep]
+            if not candidates.size:
                 break
 
-            # Verificar se o vértice pode entrar na clique custa O(k),
-            # onde k = tamanho atual da clique.
-            # No pior caso, k ≤ n, então é O(n).
-            if all(best_vertex in graph[v] for v in clique):
-                # Inserir vértice na clique é O(1)
-                clique.add(best_vertex)
-                # Atualizar candidatos = candidates ∩ vizinhos(best_vertex).
-                #
-                # intersection() novamente é O(n).
-                candidates = candidates.intersection(graph[best_vertex])
-            else:
-                # Remover vértice dos candidatos é O(1)
-                candidates.remove(best_vertex)
-        # O custo total da heurística é dominado pelo loop de seleção O(n²).
-        #
-        # Como o loop externo roda no máximo n vezes,
-        # o limite superior permanece O(n²).
+            # Só quem sai dos candidatos mexe nos contadores: cada vértice
+            # sai uma única vez e sua linha do CSR é lida uma vez → O(n + m)
+            # no total ao longo de toda a execução (mais O(n) por iteração
+            # para o bincount).
+            lost = np.concatenate([indices[indptr[v]:indptr[v + 1]] for v in leaving.tolist()])
+            degree -= np.bincount(lost, minlength=n)
+        return clique
+
+    def _numpy_clique(self) -> List[int]:
+        # A matriz empacotada só existe no espaço 0..k-1: visões são
+        # reindexadas e original[i] devolve o índice no grafo da execução.
+        graph = self.compact.compressed()
+        original = self.compact.vertex_indices()
+        packed = graph.packed
+        candidates = np.ones(graph.n, dtype=bool)
+        clique: List[int] = []
+
+        while candidates.any():
+            cand_idx = np.flatnonzero(candidates)
+            cand_bytes = np.packbits(candidates, bitorder="little")
+            # Graus dentro dos candidatos: linhas dos candidatos AND a máscara
+            # de candidatos, popcount por byte e soma por linha.
+            # O(|candidatos| · n/8) operações vetorizadas por iteração.
+            degrees = POPCOUNT8[packed[cand_idx] & cand_bytes].sum(axis=1)
+            # argmax devolve o primeiro máximo: mesmo desempate (menor índice).
+            best_vertex = int(cand_idx[np.argmax(degrees)])
+            clique.append(original[best_vertex])
+            self._improve(clique)
+            self._check_budget()
+            row = np.unpackbits(packed[best_vertex], count=graph.n, bitorder="little")
+            candidates &= row.astype(bool)
         return clique
@@ -1,58 +1,61 @@
-from typing import Set, Dict
+import heapq
+from typing import Set
 from algorithms.base import CliqueAlgorithm
-import random
 
 
 class GreedyCliqueMinDegree(CliqueAlgorithm):
     """Heurística que remove vértices de menor grau até restar uma clique."""
 
-    def _is_clique(self, vertices: Set[int]) -> bool:
-        """Verifica se o conjunto é uma clique."""
-        # Verificar se um conjunto de k vértices é clique exige
-        # verificar TODAS as k*(k-1) adjacências possíveis.
-        #
-        # Portanto, _is_clique(vertices) custa O(k²).
-        for u in vertices:
-            for v in vertices:
-                if u != v and v not in self.graph[u]:
-                    return False
-        return True
-
-    def run(self) -> Set[int]:
-        # Fazemos uma cópia do grafo. Isso custa O(n + m).
-        graph_copy = {v: set(neigh) for v, neigh in self.graph.items()}
+    @staticmethod
+    def _is_clique(num_vertices: int, num_edges: int) -> bool:
+        """Verifica se o subgrafo restante é uma clique."""
+        # Um grafo simples com k vértices é clique sse tem k(k-1)/2 arestas:
+        # basta comparar a contagem de arestas mantida pela remoção → O(1).
+        return num_edges == num_vertices * (num_vertices - 1) // 2
+
+    def _solve(self) -> Set[int]:
+        graph = self.compact
+        indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+        vertices = graph.vertex_indices()
+
+        # Graus verdadeiros do subgrafo restante e contagem de arestas.
+        degree = [0] * graph.n
+        for v in vertices:
+            degree[v] = indptr[v + 1] - indptr[v]
+        num_edges = graph.num_edges()
+        num_vertices = len(vertices)
+
+        # Fila de prioridade (grau, índice) com remoção preguiçosa: cada
+        # decremento empilha uma nova entrada e entradas obsoletas são
+        # descartadas ao sair. O desempate pelo menor índice reproduz a
+        # ordem de remoção do min() original.
+        heap = [(degree[v], v) for v in vertices]
+        heapq.heapify(heap)
+        alive = [False] * graph.n
+        for v in vertices:
+            alive[v] = True
 
         # Loop principal: removemos um vértice por iteração,
         # então podemos ter no máximo n iterações.
-        while graph_copy:
-
-            # Encontrar o vértice de menor grau exige percorrer todos os vértices.
-            # Isso é O(n) por iteração.
-            min_vertex = min(graph_copy, key=lambda x: len(graph_copy[x]))
-
-            # current_vertices tem tamanho k, começando em n e diminuindo.
-            current_vertices = set(graph_copy.keys())
-
-            # Testar se current_vertices forma uma clique custa O(k²).
-            #
-            # No início do algoritmo, k ≈ n,
-            # então este teste custa O(n²).
-            #
-            # Como ele ocorre em cada iteração,
-            # o custo acumulado da verificação de clique será O(n²) + O((n-1)²) + ...
-            # o que leva a O(n³) no pior caso.
-            if self._is_clique(current_vertices):
-                return current_vertices
-
-            # Remover o vértice de menor grau é O(1)
-            del graph_copy[min_vertex]
-
-            # Remover o vértice das listas de adjacência restantes
-            # exige percorrer todos os vértices remanescentes.
-            #
-            # Cada remoção neighbors.discard(min_vertex) é O(1),
-            # mas fazemos isso para até n vértices, então é O(n).
-            for neighbors in graph_copy.values():
-                neighbors.discard(min_vertex)
+        while num_vertices:
+            self._tick()
+            if self._is_clique(num_vertices, num_edges):
+                labels = graph.labels
+                return {labels[v] for v in vertices if alive[v]}
+
+            # Há no máximo n + m entradas na fila → O((n + m) log n) no total.
+            d, v = heapq.heappop(heap)
+            while not alive[v] or d != degree[v]:
+                d, v = heapq.heappop(heap)
+            alive[v] = False
+            num_vertices -= 1
+
+            # A remoção toca apenas os vizinhos de v: cada aresta é
+            # visitada no máximo duas vezes.
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                if alive[u]:
+                    degree[u] -= 1
+                    heapq.heappush(heap, (degree[u], u))
+                    num_edges -= 1
 
         return set()
@@ -1,55 +1,156 @@
-from typing import Set, Dict
-from algorithms.base import CliqueAlgorithm
+import multiprocessing
 import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Sequence, Set, Tuple
+import numpy as np
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+from algorithms.ordering import coloring_bound
 
-class GreedyCliqueWithRestarts(CliqueAlgorithm):
-    """Executa o algoritmo guloso múltiplas vezes com reinicializações aleatórias."""
+# Solver reaproveitado por cada processo trabalhador (criado no initializer).
+_WORKER_SOLVER: Optional["GreedyCliqueWithRestarts"] = None
 
-    def __init__(self, graph: Dict[int, Set[int]], num_restarts: int = 10):
-        super().__init__(graph)
-        self.num_restarts = num_restarts
 
-    def run(self) -> Set[int]:
-        graph = self.graph
-        vertices = list(graph.keys())
+def _init_worker(graph: CompactGraph, upper_bound: Optional[int], incumbent, budget: Optional[Budget]):
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = GreedyCliqueWithRestarts(graph, upper_bound=upper_bound)
+    _WORKER_SOLVER.incumbent = incumbent
+    _WORKER_SOLVER.budget = budget
 
-        best_clique = set()
 
-        # O algoritmo será repetido num_restarts vezes.
-        # Isso não cria exponencialidade, apenas multiplica a complexidade por um fator constante.
-        for _ in range(self.num_restarts):
+def _run_restarts(seeds: List[int]) -> Tuple[List[int], bool]:
+    return _WORKER_SOLVER._run_restarts(seeds)
 
-            # Cada reinicialização embaralha a ordem dos vértices
-            # Isso altera o comportamento guloso a cada tentativa.
-            random.shuffle(vertices)
 
-            clique = set()
-            candidates = set(vertices)
+class GreedyCliqueWithRestarts(CliqueAlgorithm):
+    """
+    Executa o algoritmo guloso múltiplas vezes com reinicializações aleatórias.
 
-            # Enquanto ainda houver vértices candidatos para tentar entrar na clique
-            while candidates:
+    Cada reinicialização usa o seu próprio ``random.Random``, semeado a partir
+    de ``seed``: o resultado é reprodutível e não depende de quantos processos
+    foram usados. Com ``max_workers > 1`` as reinicializações são divididas
+    entre processos de um ProcessPoolExecutor.
 
-                # Escolhe um vértice aleatório entre os candidatos
-                # Este passo é O(1), mas será executado várias vezes
-                vertex = random.choice(list(candidates))
+    ``upper_bound`` (por exemplo, o número de cores de uma coloração) encerra
+    a busca assim que uma reinicialização atinge esse tamanho. Sem ele, usa
+    o limite da coloração gulosa smallest-last (``coloring_bound``, O(n + m)).
+    Devolve um ``CliqueResult`` com esse limite e ``optimal`` quando a
+    clique o atinge.
+    """
 
-                # Verifica se o vértice escolhido é adjacente a *todos* da clique atual
-                # Isso custa O(|clique|) no pior caso.
-                if all(vertex in graph[v] for v in clique):
+    def __init__(
+        self,
+        graph: GraphLike,
+        num_restarts: int = 10,
+        seed: Optional[int] = None,
+        max_workers: int = 1,
+        upper_bound: Optional[int] = None,
+    ):
+        super().__init__(graph)
+        self.num_restarts = num_restarts
+        self.seed = seed
+        self.max_workers = max_workers
+        self.upper_bound = upper_bound
+        # Limite usado na execução: upper_bound ou o da coloração.
+        self._bound = upper_bound
+        # Tamanho da melhor clique compartilhado entre processos (modo paralelo).
+        self.incumbent = None
 
-                    # Se sim, adiciona à clique
-                    clique.add(vertex)
+    def _solve(self) -> Set[int]:
+        if not len(self.compact):
+            return CliqueResult(set(), upper_bound=0, optimal=True)
+        self._bound = self.upper_bound if self.upper_bound is not None else coloring_bound(self.compact)
+        # Sem seed explícita, a semente mestre vem do módulo random global,
+        # então random.seed(...) continua controlando a execução.
+        master = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+        seeds = [master.getrandbits(64) for _ in range(self.num_restarts)]
 
-                    # Atualiza candidatos para manter apenas os vizinhos do novo vértice
-                    # Essa interseção custa O(n)
-                    candidates = candidates.intersection(graph[vertex])
+        if self.max_workers > 1 and self.num_restarts > 1:
+            best, interrupted = self._run_parallel(seeds)
+        else:
+            best, interrupted = self._run_restarts(seeds)
+        if interrupted:
+            raise SearchInterrupted()
+        labels = self.compact.labels
+        return CliqueResult({labels[v] for v in best}, upper_bound=self._bound, optimal=len(best) >= self._bound)
+
+    def _run_parallel(self, seeds: List[int]) -> Tuple[List[int], bool]:
+        incumbent = multiprocessing.Value("i", 0)
+        # Lotes intercalados: cada processo recebe vários lotes, e a fila do
+        # pool redistribui os que sobram quando alguém termina antes.
+        num_batches = min(len(seeds), self.max_workers * 4)
+        batches = [seeds[i::num_batches] for i in range(num_batches)]
+
+        best: List[int] = []
+        interrupted = False
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.compact, self._bound, incumbent, self.budget),
+        ) as executor:
+            futures = [executor.submit(_run_restarts, batch) for batch in batches]
+            for future in as_completed(futures):
+                clique, timed_out = future.result()
+                interrupted = interrupted or timed_out
+                if len(clique) > len(best):
+                    best = clique
+                    self._improve(best)
+        return best, interrupted
+
+    def _reached_bound(self, size: int) -> bool:
+        if self.incumbent is not None:
+            size = max(size, self.incumbent.value)
+        return self._bound is not None and size >= self._bound
+
+    def _run_restarts(self, seeds: Sequence[int]) -> Tuple[List[int], bool]:
+        """Devolve (melhor clique, interrompida pelo orçamento)."""
+        graph = self.compact
+        indptr, indices = graph.indptr, graph.indices
+        vertices = np.array(graph.vertex_indices(), dtype=np.int64)
+        # mark[u] == v indica que u foi marcado como vizinho de v. Como a
+        # vizinhança de v não muda, marcas antigas nunca ficam erradas e o
+        # array é reaproveitado entre reinicializações sem ser zerado.
+        mark = np.full(graph.n, -1, dtype=np.int64)
+        best: List[int] = []
+
+        # O algoritmo será repetido uma vez por semente.
+        # Isso não cria exponencialidade, apenas multiplica a complexidade por um fator constante.
+        for seed in seeds:
+            if self._reached_bound(len(best)):
+                break
+            if self._budget_expired():
+                return best, True
+            rng = random.Random(seed)
+            clique = self._restart(indptr, indices, mark, vertices, rng)
+            if len(clique) > len(best):
+                best = clique
+                self._improve(best)
+                if self.incumbent is not None:
+                    with self.incumbent.get_lock():
+                        if len(best) > self.incumbent.value:
+                            self.incumbent.value = len(best)
+        return best, False
 
-                else:
-                    # Caso não entre, removemos o vértice do conjunto de candidatos
-                    candidates.remove(vertex)
+    @staticmethod
+    def _restart(
+        indptr: np.ndarray, indices: np.ndarray, mark: np.ndarray, vertices: np.ndarray, rng: random.Random
+    ) -> List[int]:
+        clique: List[int] = []
+        # Os candidatos ficam num array: sortear um é indexar uma posição
+        # aleatória, sem montar lista a cada passo.
+        candidates = vertices
 
-            # Após terminar o loop, atualiza a maior clique encontrada
-            if len(clique) > len(best_clique):
-                best_clique = clique
+        # Todo candidato é vizinho de toda a clique atual, então o vértice
+        # sorteado sempre entra e o loop roda |clique| vezes.
+        while candidates.size:
+            # Escolhe um vértice aleatório entre os candidatos → O(1)
+            vertex = int(candidates[rng.randrange(candidates.size)])
+            clique.append(vertex)
 
-        return best_clique
+            # Mantém apenas os vizinhos do novo vértice: marca a sua linha do
+            # CSR e filtra os candidatos pela marca → O(grau + |candidatos|)
+            # vetorizado, sem matriz de adjacência densa.
+            mark[indices[indptr[vertex]:indptr[vertex + 1]]] = vertex
+            candidates = candidates[mark[candidates] == vertex]
+        return clique
@@ -1,41 +1,97 @@
-from typing import Dict, Set, List
-from algorithms.base import CliqueAlgorithm
+import heapq
+from typing import Dict, Set, List, Tuple
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike
 
 
 class ColoringHeuristicClique(CliqueAlgorithm):
     """
-    Heurística de clique baseada em coloração gulosa.
-    Complexidade total aproximada: O(n²) em grafos representados por listas
-    de adjacência (dominado pelas verificações de vizinhança).
+    Heurística de clique baseada em coloração (DSATUR).
+    Complexidade total: O((n + m) log n), dominada pela coloração.
+
+    Devolve um ``CliqueResult``: além da clique, o número de cores como
+    limite superior de ω(G) e ``optimal`` quando os dois coincidem.
     """
 
-    def __init__(self, graph: Dict[int, Set[int]]):
+    def __init__(self, graph: GraphLike):
         super().__init__(graph)
 
     # -----------------------------------------------------------
-    # 1) Coloração gulosa — retorna um dicionário {v: cor}
+    # 1) Coloração DSATUR — retorna um dicionário {v: cor}
     # -----------------------------------------------------------
-    def _greedy_coloring(self) -> Dict[int, int]:
-        # Ordenar vértices por grau: O(n log n)
-        colors = {}
-        for v in sorted(self.graph, key=lambda x: -len(self.graph[x])):
-            # Coletar cores dos vizinhos já coloridos: O(grau(v))
-            neighbor_colors = {colors[n] for n in self.graph[v] if n in colors}
-
-            # Encontrar a menor cor disponível: O(k), k = cores usadas (<= n)
+    def _dsatur_coloring(self) -> Dict[int, int]:
+        """
+        DSATUR: colore primeiro o vértice com mais cores distintas na
+        vizinhança (saturação), desempatando pelo maior grau.
+
+        Os vértices não coloridos ficam em buckets por saturação; cada bucket
+        é um heap (-grau, v) com remoção preguiçosa. Quando a saturação de u
+        sobe, uma nova entrada vai para o bucket seguinte e a antiga é
+        descartada ao sair. Como a saturação total cresce no máximo m vezes,
+        o custo é O((n + m) log n).
+        """
+        graph = self.compact
+        degrees = graph.degrees().tolist()
+        indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+        vertices = graph.vertex_indices()
+
+        colors: Dict[int, int] = {}
+        # Cores distintas já presentes na vizinhança de cada vértice.
+        neighbor_colors: List[Set[int]] = [set() for _ in range(graph.n)]
+        buckets: List[List[Tuple[int, int]]] = [[(-degrees[v], v) for v in vertices]]
+        heapq.heapify(buckets[0])
+        # forbidden[c] == v marca a cor c como usada por um vizinho de v.
+        forbidden: List[int] = []
+        top = 0
+
+        for _ in range(len(vertices)):
+            self._tick()
+            # Maior saturação com algum vértice válido; entradas obsoletas
+            # (vértice já colorido ou saturação desatualizada) são descartadas.
+            while True:
+                bucket = buckets[top]
+                if not bucket:
+                    top -= 1
+                    continue
+                _, v = heapq.heappop(bucket)
+                if v not in colors and len(neighbor_colors[v]) == top:
+                    break
+
+            # Menor cor livre: marca as cores dos vizinhos e pega a primeira
+            # não marcada. A resposta é <= saturação, então custa O(grau(v)).
+            neighbors = indices[indptr[v]:indptr[v + 1]]
+            for u in neighbors:
+                c = colors.get(u)
+                if c is not None:
+                    forbidden[c] = v
             color = 0
-            while color in neighbor_colors:
+            while color < len(forbidden) and forbidden[color] == v:
                 color += 1
-
+            if color == len(forbidden):
+                forbidden.append(-1)
             colors[v] = color
-        # Custo total típico: O( ∑ grau(v) ) = O(m), pior caso O(n²)
+
+            # Atualiza a saturação dos vizinhos ainda sem cor: O(grau(v) log n)
+            for u in neighbors:
+                if u not in colors and color not in neighbor_colors[u]:
+                    neighbor_colors[u].add(color)
+                    sat = len(neighbor_colors[u])
+                    if sat == len(buckets):
+                        buckets.append([])
+                    heapq.heappush(buckets[sat], (-degrees[u], u))
+                    top = max(top, sat)
         return colors
 
     # -----------------------------------------------------------
     # 2) Constroi clique iterativamente com base nas classes de cor
     # -----------------------------------------------------------
-    def _build_clique_from_coloring(self, colors: Dict[int, int]) -> Set[int]:
-        clique: Set[int] = set()
+    def _build_clique_from_coloring(self, colors: Dict[int, int]) -> List[int]:
+        graph = self.compact
+        indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+        # hits[u] = quantos membros da clique são vizinhos de u: v entra se
+        # hits[v] == |clique|. Cada vértice que entra atualiza os contadores
+        # dos seus vizinhos uma vez, sem bitsets de O(n²) bits.
+        hits = [0] * graph.n
+        clique: List[int] = []
 
         # Agrupar vértices por cor: O(n)
         color_classes: Dict[int, List[int]] = {}
@@ -45,18 +101,28 @@ class ColoringHeuristicClique(CliqueAlgorithm):
         # Para cada classe de cor (<= n classes)
         for color in sorted(color_classes.keys()):
             for v in color_classes[color]:
-                # Testar se v é adjacente a todos da clique: O(|clique|) ⊆ O(n)
-                if all(v in self.graph[u] for u in clique):
-                    clique.add(v)
-        # Pior caso: O(n²)
+                self._tick()
+                # v é adjacente a todos da clique: teste O(1)
+                if hits[v] == len(clique):
+                    clique.append(v)
+                    self._improve(clique)
+                    for u in indices[indptr[v]:indptr[v + 1]]:
+                        hits[u] += 1
+        # O(n + m) no total
         return clique
 
-    def run(self) -> Set[int]:
-        # Coloração → O(n²)
-        colors = self._greedy_coloring()
+    def _solve(self) -> CliqueResult:
+        # Coloração DSATUR → O((n + m) log n)
+        colors = self._dsatur_coloring()
 
-        # Construção da clique → O(n²)
+        # Construção da clique → O(n + m)
         clique = self._build_clique_from_coloring(colors)
 
-        # Complexidade total: O(n²) típico / O(n² + m) geral
-        return clique
+        # Toda clique usa cores distintas, então o número de cores é um
+        # limite superior para ω(G). Se a clique encontrada o atinge, ela
+        # é comprovadamente máxima e nenhum solver exato é necessário.
+        upper_bound = max(colors.values(), default=-1) + 1
+        labels = self.compact.labels
+        return CliqueResult(
+            {labels[v] for v in clique}, upper_bound=upper_bound, optimal=len(clique) == upper_bound
+        )
@@ -0,0 +1,145 @@
+import random
+import time
+from typing import List, Optional, Set
+from algorithms.base import CliqueAlgorithm, GraphLike, SearchInterrupted
+from algorithms.heuristics.enhancement.tightness import TightnessState
+
+
+class DynamicLocalSearchClique(CliqueAlgorithm):
+    """
+    Busca local dinâmica para clique máxima (DLS-MC, Pullan e Hoos).
+
+    Alterna três fases sobre um ``TightnessState``:
+      - expansão: adiciona vértices 0-missing enquanto houver;
+      - platô: troca um membro por um vértice 1-missing, sem revisitar
+        vértices removidos na mesma fase, até a clique perder todos os
+        vértices que tinha no início do platô;
+      - perturbação: ao fim de cada platô os membros da clique ganham +1 de
+        penalidade (a cada ``penalty_delay`` ciclos todas decrescem 1). Com
+        ``penalty_delay > 1`` a clique é reduzida ao último vértice
+        adicionado; caso contrário, um vértice aleatório é inserido e seus
+        não vizinhos saem.
+    Em expansão e platô escolhe-se sempre o vértice de menor penalidade,
+    o que afasta a busca de vértices que aparecem em muitos ótimos locais.
+
+    A execução termina após ``max_steps`` movimentos (cada ciclo de
+    penalidade/perturbação conta como um), após ``time_limit`` segundos (se
+    informado) ou ao atingir ``upper_bound`` (se informado) ou o limite
+    trivial min(|V|, grau máximo + 1).
+    """
+
+    def __init__(
+        self,
+        graph: GraphLike,
+        max_steps: int = 20000,
+        time_limit: Optional[float] = None,
+        penalty_delay: int = 2,
+        upper_bound: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(graph)
+        self.max_steps = max_steps
+        self.time_limit = time_limit
+        self.penalty_delay = penalty_delay
+        self.upper_bound = upper_bound
+        self.seed = seed
+        self.steps = 0
+
+    def _select(self, candidates: List[int], penalty: List[int], rng: random.Random) -> int:
+        # Menor penalidade, empate aleatório: O(|candidatos|).
+        lowest = min(penalty[v] for v in candidates)
+        ties = [v for v in candidates if penalty[v] == lowest]
+        return ties[rng.randrange(len(ties))]
+
+    def _solve(self) -> Set[int]:
+        state = TightnessState(self.compact)
+        if not state.vertices:
+            return set()
+        rng = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+        penalty = [0] * self.compact.n
+        cycles = 0
+        self.steps = 0
+        # Nenhuma clique passa do grau máximo + 1 (nem do número de vértices).
+        bound = int(self.compact.degrees()[state.vertices].max()) + 1
+        if self.upper_bound is not None:
+            bound = min(bound, self.upper_bound)
+
+        def exhausted() -> bool:
+            if self.steps >= self.max_steps:
+                return True
+            if len(best) >= bound:
+                return True
+            if deadline is not None and time.perf_counter() >= deadline:
+                return True
+            return self._budget_expired()
+
+        last_added = state.vertices[rng.randrange(len(state.vertices))]
+        state.add(last_added)
+        best = list(state.clique)
+        self._improve(best)
+
+        while not exhausted():
+            # ------------ Expansão ------------
+            free = state.free()
+            while free and not exhausted():
+                last_added = self._select(free, penalty, rng)
+                state.add(last_added)
+                self.steps += 1
+                free = state.free()
+            if state.size > len(best):
+                best = list(state.clique)
+                self._improve(best)
+
+            # ------------ Platô ------------
+            # O platô termina quando nenhum vértice da clique inicial resta.
+            initial = set(state.clique)
+            overlap = len(initial)
+            removed: Set[int] = set()
+            while not state.free() and overlap and not exhausted():
+                allowed = [x for x in state.one_missing() if x not in removed]
+                if not allowed:
+                    break
+                x = self._select(allowed, penalty, rng)
+                v = state.missing_neighbor(x)
+                state.swap(v, x)
+                last_added = x
+                removed.add(v)
+                if v in initial:
+                    overlap -= 1
+                self.steps += 1
+            if state.free():
+                continue
+
+            # ------------ Penalidades ------------
+            # O ciclo conta como passo: sem movimentos de expansão ou platô
+            # (ex.: grafo sem arestas), só ele faz a busca avançar.
+            self.steps += 1
+            for v in state.clique:
+                penalty[v] += 1
+            cycles += 1
+            if cycles % self.penalty_delay == 0:
+                for v in state.vertices:
+                    if penalty[v]:
+                        penalty[v] -= 1
+
+            # ------------ Perturbação ------------
+            if self.penalty_delay > 1:
+                for u in list(state.clique):
+                    if u != last_added:
+                        state.drop(u)
+            else:
+                outside = [v for v in state.vertices if not state.in_clique[v]]
+                if outside:
+                    last_added = outside[rng.randrange(len(outside))]
+                    state.mark_neighbors(last_added)
+                    for u in [u for u in state.clique if not state.is_marked(u)]:
+                        state.drop(u)
+                    state.add(last_added)
+
+        # Orçamento da interface anytime (não o time_limit próprio): a melhor
+        # clique já foi reportada, só sinalizamos a interrupção.
+        if self._budget_expired():
+            raise SearchInterrupted()
+        labels = self.compact.labels
+        return {labels[v] for v in best}
@@ -1,88 +1,133 @@
-from typing import Set, Dict, List
-from algorithms.base import CliqueAlgorithm
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Set, List, Optional, Tuple
+from algorithms.base import CliqueAlgorithm, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph, iter_bits
 import random
 
+# GA reaproveitado por cada processo trabalhador (uma ilha por tarefa). O
+# cache de fitness do processo sobrevive entre épocas de migração.
+_WORKER_GA: Optional["GeneticAlgorithmClique"] = None
+
+
+def _init_worker(graph: CompactGraph, population_size: int, mutation_rate: float, budget: Optional[Budget]):
+    global _WORKER_GA
+    _WORKER_GA = GeneticAlgorithmClique(graph, population_size=population_size, mutation_rate=mutation_rate)
+    _WORKER_GA.budget = budget
+
+
+def _evolve_island(task: Tuple[Optional[List[int]], int, int]) -> List[int]:
+    population, generations, seed = task
+    _WORKER_GA._rng = random.Random(seed)
+    if population is None:
+        population = _WORKER_GA._initial_population()
+    return _WORKER_GA._evolve(population, generations)
+
 
 class GeneticAlgorithmClique(CliqueAlgorithm):
     """
     Algoritmo Genético para busca de cliques grandes.
+    Cada indivíduo é um bitset sobre os índices do CompactGraph.
+
+    O fitness é memorizado por indivíduo (o próprio bitset é a chave), então
+    cada clique distinta é verificada uma única vez.
+
+    Com ``islands > 1`` a população é dividida em ilhas que evoluem em
+    processos separados; a cada ``migration_interval`` gerações os
+    ``migration_size`` melhores de cada ilha substituem os piores da ilha
+    seguinte (topologia em anel). ``seed`` torna a execução reprodutível.
     """
 
     def __init__(
         self,
-        graph: Dict[int, Set[int]],
+        graph: GraphLike,
         population_size: int = 50,
         generations: int = 100,
-        mutation_rate: float = 0.1
+        mutation_rate: float = 0.1,
+        islands: int = 1,
+        migration_interval: int = 10,
+        migration_size: int = 2,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
     ):
         super().__init__(graph)
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.max_workers = max_workers or min(islands, os.cpu_count() or 1)
+        self.seed = seed
+        self._degrees = self.compact.degrees()
+        self._fitness_cache: Dict[int, int] = {}
+        self._rng = random.Random(seed if seed is not None else random.getrandbits(64))
 
     # -----------------------------
     # Funções auxiliares
     # -----------------------------
 
     @staticmethod
-    def _is_clique(graph: Dict[int, Set[int]], clique: Set[int]) -> bool:
-        # Verificação completa: O(k²), onde k = |clique|
-        for u in clique:
-            for v in clique:
-                if u != v and v not in graph[u]:
-                    return False
-        return True
-
-    def _fitness(self, clique: Set[int]) -> int:
-        # Apenas chama _is_clique → O(k²)
-        return len(clique) if self._is_clique(self.graph, clique) else 0
-
-    def _repair(self, clique: Set[int]) -> Set[int]:
+    def _is_clique(graph: CompactGraph, clique: int) -> bool:
+        # Verificação completa: O(k) ANDs, onde k = |clique|
+        return graph.is_clique(clique)
+
+    def _fitness(self, clique: int) -> int:
+        # Consulta ao cache O(1); _is_clique (O(k)) só na primeira vez
+        # que o indivíduo aparece.
+        fitness = self._fitness_cache.get(clique)
+        if fitness is None:
+            fitness = clique.bit_count() if self._is_clique(self.compact, clique) else 0
+            self._fitness_cache[clique] = fitness
+        return fitness
+
+    def _repair(self, clique: int) -> int:
         # Ordenação O(k log k)
-        # Construção checando compatibilidade: O(k²)
-        # Total: O(k²)
-        graph = self.graph
-        valid = set()
-        for v in sorted(clique, key=lambda x: len(graph[x]), reverse=True):
-            if all(v in graph[u] for u in valid):  # O(k)
-                valid.add(v)
+        # Construção checando compatibilidade: um AND por vértice
+        # Total: O(k log k)
+        masks = self.compact.masks
+        degrees = self._degrees
+        valid = 0
+        for v in sorted(iter_bits(clique), key=lambda x: degrees[x], reverse=True):
+            if valid & ~masks[v] == 0:  # O(n/64)
+                valid |= 1 << v
         return valid
 
-    def _crossover(self, p1: Set[int], p2: Set[int]) -> Set[int]:
-        # União O(k)
-        # Reparo O(k²)
-        return self._repair(p1.union(p2))
-
-    def _mutate(self, clique: Set[int]) -> Set[int]:
-        # Seleção aleatória de até 3 vértices: O(1)
-        # Cada tentativa verifica compatibilidade: O(k)
-        # Total: O(k)
-        if random.random() < self.mutation_rate:
-            graph = self.graph
-            candidates = set(graph.keys()) - clique
-            for v in random.sample(list(candidates), min(3, len(candidates))):
-                if all(v in graph[u] for u in clique):  # O(k)
-                    clique.add(v)
+    def _crossover(self, p1: int, p2: int) -> int:
+        # União: um OR
+        # Reparo O(k log k)
+        return self._repair(p1 | p2)
+
+    def _mutate(self, clique: int) -> int:
+        # Seleção aleatória de até 3 vértices: O(n)
+        # Cada tentativa verifica compatibilidade: um AND
+        if self._rng.random() < self.mutation_rate:
+            masks = self.compact.masks
+            candidates = list(iter_bits(self.compact.vertices & ~clique))
+            for v in self._rng.sample(candidates, min(3, len(candidates))):
+                if clique & ~masks[v] == 0:  # O(n/64)
+                    clique |= 1 << v
         return clique
 
     # -----------------------------
     # População inicial
     # -----------------------------
 
-    def _random_clique(self) -> Set[int]:
+    def _random_clique(self) -> int:
         # Embaralhamento O(n)
-        # Tentativa de inserção: O(n * k) ≈ O(n²) no pior caso
-        graph = self.graph
-        vertices = list(graph.keys())
-        random.shuffle(vertices)
+        # Tentativa de inserção: O(n) ANDs de O(n/64)
+        masks = self.compact.masks
+        vertices = self.compact.vertex_indices()
+        self._rng.shuffle(vertices)
 
-        clique = set()
+        clique = 0
         for v in vertices:
-            if all(v in graph[u] for u in clique):  # O(k)
-                clique.add(v)
+            if clique & ~masks[v] == 0:  # O(n/64)
+                clique |= 1 << v
         return clique
 
-    def _initial_population(self) -> List[Set[int]]:
+    def _initial_population(self) -> List[int]:
         # Gera P indivíduos → P * O(n²)
         return [self._random_clique() for _ in range(self.population_size)]
 
@@ -90,11 +135,65 @@ class GeneticAlgorithmClique(CliqueAlgorithm):
     # Execução principal
     # -----------------------------
 
-    def run(self) -> Set[int]:
+    def _evolve(self, population: List[int], generations: int) -> List[int]:
+        """Evolui a população e a devolve ordenada por fitness decrescente."""
+        size = len(population)
+        for _ in range(generations):
+            # Com o orçamento esgotado a população atual é devolvida como está.
+            if self._budget_expired():
+                break
+            # seleção: ordena por fitness (cache O(1) por indivíduo) → O(P log P)
+            population.sort(key=self._fitness, reverse=True)
+            survivors = population[: size // 2]
+            self._improve(survivors[0])
+
+            # reprodução
+            new_population = survivors.copy()
+            while len(new_population) < size:
+                p1, p2 = self._rng.sample(survivors, 2)  # O(1)
+                child = self._crossover(p1, p2)          # O(k²)
+                child = self._mutate(child)              # O(k)
+                new_population.append(child)
+
+            population = new_population  # O(1)
+        population.sort(key=self._fitness, reverse=True)
+        return population
+
+    def _run_islands(self) -> List[int]:
+        island_size = max(self.population_size // self.islands, 4)
+        epochs = -(-self.generations // self.migration_interval)
+        populations: List[Optional[List[int]]] = [None] * self.islands
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.compact, island_size, self.mutation_rate, self.budget),
+        ) as executor:
+            for epoch in range(epochs):
+                if epoch and self._budget_expired():
+                    break
+                generations = min(self.migration_interval, self.generations - epoch * self.migration_interval)
+                # Uma semente por ilha e época, tirada do gerador mestre:
+                # o resultado não depende de qual processo roda cada ilha.
+                tasks = [(pop, generations, self._rng.getrandbits(64)) for pop in populations]
+                populations = list(executor.map(_evolve_island, tasks))
+
+                # Migração em anel: as elites da ilha i substituem os piores
+                # da ilha i + 1 (cada população volta ordenada por fitness).
+                k = min(self.migration_size, island_size // 2)
+                elites = [pop[:k] for pop in populations]
+                for i in range(self.islands):
+                    target = populations[(i + 1) % self.islands]
+                    target[len(target) - k:] = elites[i]
+                self._improve(max((pop[0] for pop in populations), key=self._fitness))
+
+        return [ind for pop in populations for ind in pop]
+
+    def _solve(self) -> Set[int]:
         """
         Complexidade geral:
         - Cada geração faz:
-            * ordenação da população: O(P log P * k²)
+            * ordenação da população: O(P log P) com fitness em cache
             * reprodução + mutação: O(P * k²)
         - Total: O(G * P * k²)
         Onde:
@@ -103,23 +202,16 @@ class GeneticAlgorithmClique(CliqueAlgorithm):
             P = população
             G = gerações
         """
-        population = self._initial_population()  # O(P * n²)
-
-        for _ in range(self.generations):
-            # seleção: ordena por fitness (fitness = O(k²)) → O(P log P * k²)
-            population.sort(key=lambda c: self._fitness(c), reverse=True)
-            survivors = population[: self.population_size // 2]
-
-            # reprodução
-            new_population = survivors.copy()
-            while len(new_population) < self.population_size:
-                p1, p2 = random.sample(survivors, 2)  # O(1)
-                child = self._crossover(p1, p2)       # O(k²)
-                child = self._mutate(child)           # O(k)
-                new_population.append(child)
-
-            population = new_population  # O(1)
-
-        # melhor indivíduo final: O(P * k²)
-        best = max(population, key=lambda c: self._fitness(c))
-        return best
+        if not len(self.compact):
+            return set()
+        if self.islands > 1:
+            population = self._run_islands()
+        else:
+            population = self._evolve(self._initial_population(), self.generations)
+
+        # melhor indivíduo final: O(P) consultas ao cache
+        best = max(population, key=self._fitness)
+        self._improve(best)
+        if self._budget_expired():
+            raise SearchInterrupted()
+        return self.compact.to_labels(best)
@@ -0,0 +1,141 @@
+import random
+from typing import Optional, Set
+import numpy as np
+from algorithms.base import CliqueAlgorithm, GraphLike
+
+
+class VectorizedGeneticAlgorithmClique(CliqueAlgorithm):
+    """
+    Algoritmo Genético com a população inteira em matrizes NumPy.
+
+    Mesmo esquema do GeneticAlgorithmClique (seleção da melhor metade,
+    crossover por união + reparo guloso por grau, mutação que tenta inserir
+    até 3 vértices), mas cada operação age sobre todos os indivíduos de uma
+    vez:
+      - a população é uma matriz booleana P x n, com uma cópia empacotada
+        (P x ceil(n/8)) usada nos testes de adjacência;
+      - crossover e mutação são operações de array (OR de linhas, sorteios
+        em lote);
+      - o reparo percorre apenas as colunas ativas (vértices presentes em
+        algum filho), em ordem de grau decrescente, e testa "adjacente a
+        todos os já escolhidos" para todos os filhos que contêm a coluna com
+        um AND entre linhas empacotadas.
+    Não há laço do interpretador por vértice de cada indivíduo, o que permite
+    populações de milhares de indivíduos em grafos com milhares de vértices.
+    """
+
+    def __init__(
+        self,
+        graph: GraphLike,
+        population_size: int = 50,
+        generations: int = 100,
+        mutation_rate: float = 0.1,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(graph)
+        self.population_size = population_size
+        self.generations = generations
+        self.mutation_rate = mutation_rate
+        self.seed = seed
+
+    def _solve(self) -> Set[int]:
+        # Trabalhamos no espaço de índices 0..k-1 (visões são reindexadas).
+        graph = self.compact.compressed()
+        n = graph.n
+        if not n:
+            return set()
+        rng = np.random.default_rng(self.seed if self.seed is not None else random.getrandbits(64))
+        packed = graph.packed
+        # non_adjacent[v]: bits dos vértices NÃO adjacentes a v.
+        self._non_adjacent = ~packed
+        # Ordem do reparo: grau decrescente (rank menor = maior grau).
+        order = np.argsort(-graph.degrees(), kind="stable")
+        self._rank = np.empty(n, dtype=np.int64)
+        self._rank[order] = np.arange(n)
+
+        population = self._initial_population(packed, rng)
+        size = population.shape[0]
+        half = max(size // 2, 2)
+
+        labels = graph.labels
+        for _ in range(self.generations):
+            # seleção: fitness é o tamanho da clique (todos são cliques) → O(P·n)
+            fitness = population.sum(axis=1)
+            survivors = population[np.argsort(-fitness, kind="stable")[:half]]
+            # O grafo pode ter sido reindexado: reportamos já em rótulos.
+            self._improve_labels(labels[v] for v in np.flatnonzero(survivors[0]).tolist())
+            self._check_budget()
+
+            # reprodução: pares sorteados em lote e união das linhas
+            # (p2 sorteado entre os half - 1 restantes, então p1 != p2).
+            num_children = size - half
+            p1 = rng.integers(0, half, size=num_children)
+            p2 = rng.integers(0, half - 1, size=num_children)
+            p2 += p2 >= p1
+            children = survivors[p1] | survivors[p2]
+            children = self._repair(children)
+            children = self._mutate(children, rng)
+
+            population = np.concatenate([survivors, children])
+
+        best = population[np.argmax(population.sum(axis=1))]
+        return {labels[v] for v in np.flatnonzero(best).tolist()}
+
+    # -----------------------------
+    # Operadores em lote
+    # -----------------------------
+
+    def _initial_population(self, packed: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        # Guloso aleatório em lote: a cada rodada cada indivíduo escolhe um
+        # candidato aleatório e os candidatos viram candidatos ∩ vizinhos.
+        # Rodadas = tamanho da maior clique gerada; cada uma é O(P·n).
+        n = packed.shape[0]
+        size = max(self.population_size, 2)
+        population = np.zeros((size, n), dtype=bool)
+        candidates = np.ones((size, n), dtype=bool)
+        rows = np.arange(size)
+        while True:
+            alive = candidates.any(axis=1)
+            if not alive.any():
+                break
+            keys = np.where(candidates, rng.integers(1, 1 << 16, size=(size, n), dtype=np.int32), 0)
+            chosen = keys.argmax(axis=1)
+            r, v = rows[alive], chosen[alive]
+            population[r, v] = True
+            neighbors = np.unpackbits(packed[v], axis=1, count=n, bitorder="little").astype(bool)
+            candidates[r] &= neighbors
+        return population
+
+    def _repair(self, children: np.ndarray) -> np.ndarray:
+        # Colunas ativas em ordem de grau decrescente: O(ativas) passos, cada
+        # um testando todos os filhos que contêm a coluna de uma só vez.
+        num, n = children.shape
+        nbytes = self._non_adjacent.shape[1]
+        active = np.flatnonzero(children.any(axis=0))
+        active = active[np.argsort(self._rank[active], kind="stable")]
+        by_column = np.asfortranarray(children)
+        repaired = np.zeros((num, n), dtype=bool)
+        repaired_packed = np.zeros((num, nbytes), dtype=np.uint8)
+        for v in active.tolist():
+            holders = np.flatnonzero(by_column[:, v])
+            # v entra se nenhum escolhido está entre os não vizinhos de v.
+            conflict = (repaired_packed[holders] & self._non_adjacent[v]).any(axis=1)
+            accepted = holders[~conflict]
+            repaired[accepted, v] = True
+            repaired_packed[accepted, v >> 3] |= np.uint8(1 << (v & 7))
+        return repaired
+
+    def _mutate(self, children: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        # Indivíduos sorteados tentam inserir até 3 vértices aleatórios;
+        # cada tentativa é um AND em lote contra a clique empacotada.
+        num, n = children.shape
+        mutants = np.flatnonzero(rng.random(num) < self.mutation_rate)
+        if not mutants.size:
+            return children
+        clique = np.packbits(children[mutants], axis=1, bitorder="little")
+        for v in rng.integers(0, n, size=(3, mutants.size)):
+            ok = ~(clique & self._non_adjacent[v]).any(axis=1) & ~children[mutants, v]
+            rows = mutants[ok]
+            children[rows, v[ok]] = True
+            clique[np.flatnonzero(ok), v[ok] >> 3] |= (1 << (v[ok] & 7)).astype(np.uint8)
+        return children
@@ -0,0 +1,117 @@
+from typing import Callable, List, Optional, Tuple
+from algorithms.compact_graph import CompactGraph, iter_bits
+
+
+def _neighbor_lists(graph: CompactGraph) -> Callable[[int], List[int]]:
+    # Visões induzidas leem a vizinhança pelos bitsets (O(grau) por vértice,
+    # sem filtrar o CSR inteiro do grafo original); grafos completos usam CSR.
+    if graph.is_view:
+        masks = graph.masks
+        return lambda v: list(iter_bits(masks[v]))
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    return lambda v: indices[indptr[v]:indptr[v + 1]]
+
+
+def core_decomposition(graph: CompactGraph) -> Tuple[List[int], List[int]]:
+    """
+    Decomposição em k-cores de Batagelj–Zaversnik em O(n + m).
+
+    Os vértices ficam num vetor ordenado por grau (bucket sort), com
+    ``bin[d]`` apontando para o início do bucket de grau d. Remover o
+    vértice de menor grau e decrementar um vizinho são trocas O(1) dentro
+    desse vetor, sem reordenar nada.
+
+    Retorna (ordem de remoção, core number por índice).
+    """
+    neighbors = _neighbor_lists(graph)
+    vertices = graph.vertex_indices()
+    n = graph.n
+    k = len(vertices)
+
+    degree = [0] * n
+    for v in vertices:
+        degree[v] = len(neighbors(v))
+    max_degree = max((degree[v] for v in vertices), default=0)
+
+    # Bucket sort dos vértices por grau → O(n + Δ)
+    bins = [0] * (max_degree + 1)
+    for v in vertices:
+        bins[degree[v]] += 1
+    start = 0
+    for d in range(max_degree + 1):
+        bins[d], start = start, start + bins[d]
+
+    pos = [0] * n
+    order = [0] * k
+    for v in vertices:
+        pos[v] = bins[degree[v]]
+        order[pos[v]] = v
+        bins[degree[v]] += 1
+    for d in range(max_degree, 0, -1):
+        bins[d] = bins[d - 1]
+    bins[0] = 0
+
+    # Cada aresta é visitada no máximo duas vezes → O(m)
+    for i in range(k):
+        v = order[i]
+        for u in neighbors(v):
+            du = degree[u]
+            if du > degree[v]:
+                # Troca u com o primeiro vértice do seu bucket e encolhe o bucket.
+                pw = bins[du]
+                w = order[pw]
+                if u != w:
+                    pu = pos[u]
+                    order[pu], order[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                bins[du] += 1
+                degree[u] = du - 1
+
+    return order, degree
+
+
+def core_numbers(graph: CompactGraph) -> List[int]:
+    """Core number de cada vértice, indexado pelo índice compacto."""
+    return core_decomposition(graph)[1]
+
+
+def degeneracy_ordering(graph: CompactGraph) -> List[int]:
+    """
+    Ordem de degenerescência: vértices na ordem em que a decomposição em
+    k-cores os remove. Cada vértice tem no máximo ``degeneracy(graph)``
+    vizinhos posteriores a ele na ordem.
+    """
+    return core_decomposition(graph)[0]
+
+
+def degeneracy(graph: CompactGraph) -> int:
+    """Maior core number do grafo (0 para grafo vazio)."""
+    order, core = core_decomposition(graph)
+    return max((core[v] for v in order), default=0)
+
+
+def coloring_bound(graph: CompactGraph, order: Optional[List[int]] = None) -> int:
+    """
+    Número de cores da coloração gulosa na ordem smallest-last, um limite
+    superior para o tamanho da clique máxima (<= degenerescência + 1).
+
+    ``order`` é a ordem de degenerescência, se já calculada. O(n + m).
+    """
+    if order is None:
+        order = degeneracy_ordering(graph)
+    # Na ordem inversa de remoção cada vértice tem no máximo
+    # "degenerescência" vizinhos já coloridos.
+    neighbors = _neighbor_lists(graph)
+    color = [0] * graph.n
+    used = [0] * (len(order) + 1)
+    num_colors = 0
+    for stamp, v in enumerate(reversed(order), start=1):
+        for u in neighbors(v):
+            if color[u]:
+                used[color[u] - 1] = stamp
+        c = 0
+        while used[c] == stamp:
+            c += 1
+        color[v] = c + 1
+        num_colors = max(num_colors, c + 1)
+    return num_colors
@@ -0,0 +1,149 @@
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+from algorithms.base import CliqueAlgorithm, CliqueResult, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+from algorithms.exact.backtracking import BacktrackingClique
+from algorithms.exact.bitboard_branch_bound import BitParallelClique
+from algorithms.exact.brute_force import BruteForceClique
+from algorithms.exact.coloring_branch_bound import ColoringBranchBoundClique
+from algorithms.exact.divide_conquer import DivideConquerClique
+from algorithms.exact.dp_bitmask import DPCliqueBitmask
+from algorithms.heuristics.enhancement.local_search import LocalSearchClique
+from algorithms.heuristics.greedy.greedy_core import GreedyCliqueCoreDecomposition
+from algorithms.heuristics.hybrid.coloring_heuristic import ColoringHeuristicClique
+
+# Membro do portfólio: a classe do solver ou (classe, kwargs do construtor).
+Member = Union[Type[CliqueAlgorithm], Tuple[Type[CliqueAlgorithm], Dict]]
+
+# Solvers cujo término sem interrupção prova a otimalidade.
+_EXACT_SOLVERS = (
+    BruteForceClique,
+    BacktrackingClique,
+    DivideConquerClique,
+    DPCliqueBitmask,
+    ColoringBranchBoundClique,
+    BitParallelClique,
+)
+
+# Intervalo (s) com que o processo principal confere o próprio orçamento
+# enquanto espera os membros.
+_POLL_INTERVAL = 0.05
+
+# Estado de cada processo membro, definido pelo initializer do pool.
+_WORKER_GRAPH: Optional[CompactGraph] = None
+_WORKER_INCUMBENT = None
+_WORKER_STOP = None
+
+
+def _init_worker(graph: CompactGraph, incumbent, stop):
+    global _WORKER_GRAPH, _WORKER_INCUMBENT, _WORKER_STOP
+    _WORKER_GRAPH = graph
+    _WORKER_INCUMBENT = incumbent
+    _WORKER_STOP = stop
+
+
+def _run_member(task: Tuple[Type[CliqueAlgorithm], Dict, Optional[float]]) -> Tuple[Set, Optional[int], bool]:
+    """Roda um membro; devolve (clique, limite superior, otimalidade provada)."""
+    member_class, kwargs, deadline = task
+    solver = member_class(_WORKER_GRAPH, **kwargs)
+    exact = issubclass(member_class, _EXACT_SOLVERS)
+    if exact and hasattr(solver, "incumbent"):
+        # O solver exato poda com o melhor tamanho conhecido por todos.
+        solver.incumbent = _WORKER_INCUMBENT
+
+    def publish(elapsed: float, clique: Set):
+        with _WORKER_INCUMBENT.get_lock():
+            if len(clique) > _WORKER_INCUMBENT.value:
+                _WORKER_INCUMBENT.value = len(clique)
+
+    # O stop compartilhado é o sinal de cancelamento do Budget do membro.
+    result = solver.run(budget=Budget(deadline=deadline, event=_WORKER_STOP), on_improvement=publish)
+    upper_bound = getattr(result, "upper_bound", None)
+    proven = (exact and not solver.timed_out) or getattr(result, "optimal", False)
+    if proven:
+        _WORKER_STOP.set()
+    return set(result), upper_bound, proven
+
+
+class PortfolioClique(CliqueAlgorithm):
+    """
+    Portfólio concorrente: vários solvers rodam ao mesmo tempo, um por
+    processo, e devolve-se a melhor clique entre todos.
+
+    Os membros compartilham o tamanho da melhor clique conhecida num
+    ``multiprocessing.Value``: cada melhora de qualquer membro é publicada
+    nele, e solvers exatos com suporte a incumbente compartilhado
+    (``BitParallelClique``, ``BacktrackingClique``) o usam como limite de
+    poda, então as cliques das heurísticas encurtam a busca exata.
+
+    Um ``multiprocessing.Event`` faz o papel de cancelamento do Budget de
+    cada membro. Ele é disparado quando a otimalidade é provada (um membro
+    exato termina sem interrupção, ou uma clique atinge um limite superior
+    como o da coloração DSATUR) ou quando o orçamento do portfólio acaba;
+    os demais membros então devolvem sua melhor clique parcial.
+
+    O resultado é um ``CliqueResult`` com ``optimal`` e o menor
+    ``upper_bound`` reportado pelos membros.
+    """
+
+    DEFAULT_MEMBERS: Sequence[Member] = (
+        GreedyCliqueCoreDecomposition,
+        LocalSearchClique,
+        ColoringHeuristicClique,
+        BitParallelClique,
+    )
+
+    def __init__(self, graph: GraphLike, members: Optional[Sequence[Member]] = None):
+        super().__init__(graph)
+        self.members: List[Tuple[Type[CliqueAlgorithm], Dict]] = [
+            member if isinstance(member, tuple) else (member, {})
+            for member in (members or self.DEFAULT_MEMBERS)
+        ]
+
+    def _solve(self) -> Set[int]:
+        if not len(self.compact):
+            return CliqueResult(set(), upper_bound=0, optimal=True)
+        incumbent = multiprocessing.Value("i", 0)
+        stop = multiprocessing.Event()
+        deadline = self.budget.deadline if self.budget is not None else None
+
+        best: Set = set()
+        upper_bound: Optional[int] = None
+        proven = False
+        with ProcessPoolExecutor(
+            max_workers=len(self.members),
+            initializer=_init_worker,
+            initargs=(self.compact, incumbent, stop),
+        ) as executor:
+            pending = {
+                executor.submit(_run_member, (member_class, kwargs, deadline))
+                for member_class, kwargs in self.members
+            }
+            while pending:
+                done, pending = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    clique, bound, optimal = future.result()
+                    if len(clique) > len(best):
+                        best = clique
+                        self._improve_labels(best)
+                    if bound is not None:
+                        upper_bound = bound if upper_bound is None else min(upper_bound, bound)
+                    proven = proven or optimal
+                if proven or (upper_bound is not None and len(best) >= upper_bound):
+                    proven = True
+                    stop.set()
+                elif self._budget_expired():
+                    # Cancelamento do Budget do portfólio (ou prazo): todos
+                    # os membros param e devolvem sua melhor clique.
+                    stop.set()
+
+        # Um membro exato prova que não há clique maior que o incumbente
+        # compartilhado; a prova vale se alguma clique coletada o atinge.
+        proven = proven and len(best) >= incumbent.value
+        if not proven and self._budget_expired():
+            raise SearchInterrupted()
+        if proven:
+            upper_bound = len(best)
+        return CliqueResult(best, upper_bound=upper_bound, optimal=proven)
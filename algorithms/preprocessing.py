@@ -0,0 +1,241 @@
+from typing import Any, List, Optional, Sequence, Set, Tuple, Type
+from algorithms.base import CliqueAlgorithm, GraphLike, SearchInterrupted
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph, iter_bits, mask_from_indices
+from algorithms.heuristics.greedy.greedy_core import GreedyCliqueCoreDecomposition
+from algorithms.heuristics.greedy.greedy_degree import GreedyCliqueDegree
+from algorithms.ordering import core_decomposition
+
+# A cada quantos vértices a remoção por dominância confere o orçamento.
+_BUDGET_INTERVAL = 256
+
+# Heurísticas O(n + m) cujo melhor resultado é o limite inferior padrão.
+_LOWER_BOUND_HEURISTICS: Sequence[Type[CliqueAlgorithm]] = (
+    GreedyCliqueCoreDecomposition,
+    GreedyCliqueDegree,
+)
+
+
+class ReductionReport:
+    """Quanto o pré-processamento reduziu o grafo, etapa por etapa."""
+
+    def __init__(self, graph: CompactGraph, lower_bound: int):
+        self.original_vertices = len(graph)
+        self.original_edges = graph.num_edges()
+        self.lower_bound = lower_bound
+        self.removed_by_core = 0
+        self.removed_by_domination = 0
+        self.removed_small_kernels = 0
+        self.rounds = 0
+        self.kernel_sizes: List[int] = []
+        self.reduced_edges = 0
+        self.interrupted = False
+
+    @property
+    def reduced_vertices(self) -> int:
+        return sum(self.kernel_sizes)
+
+    @property
+    def reduction(self) -> float:
+        """Fração dos vértices eliminada antes da busca (0 a 1)."""
+        if not self.original_vertices:
+            return 0.0
+        return 1 - self.reduced_vertices / self.original_vertices
+
+    def __str__(self) -> str:
+        if self.interrupted:
+            return f"redução interrompida pelo orçamento; limite inferior {self.lower_bound}"
+        return (
+            f"{self.original_vertices} -> {self.reduced_vertices} vértices "
+            f"({self.reduction:.1%} removidos), {self.original_edges} -> {self.reduced_edges} arestas; "
+            f"limite inferior {self.lower_bound}; core: {self.removed_by_core}, "
+            f"dominância: {self.removed_by_domination}, kernels pequenos: {self.removed_small_kernels}; "
+            f"{len(self.kernel_sizes)} kernel(s) em {self.rounds} rodada(s)"
+        )
+
+
+def preprocess(
+    graph: CompactGraph,
+    heuristics: Sequence[Type[CliqueAlgorithm]] = _LOWER_BOUND_HEURISTICS,
+    budget: Optional[Budget] = None,
+) -> Tuple[Set, List[CompactGraph], ReductionReport]:
+    """
+    Reduz o grafo antes da busca por uma clique MAIOR que a de uma heurística.
+
+    1. Limite inferior: a maior clique entre as ``heuristics`` (por padrão
+       as gulosas por core number e por grau, ambas O(n + m)), de tamanho lb.
+    2. Poda por core: um vértice numa clique de tamanho > lb tem core >= lb,
+       então vértices com core < lb saem.
+    3. Dominância: se u e v não são adjacentes e N(u) ⊆ N(v), qualquer clique
+       com u continua clique trocando u por v; u sai sem alterar ω.
+    As etapas 2 e 3 se repetem até nada mudar (cada remoção pode baixar o
+    core de outros vértices). Por fim, o que sobra é dividido em componentes
+    conexos (kernels independentes), descartando os com <= lb vértices.
+
+    Retorna (clique do limite inferior, kernels como visões induzidas, relatório).
+
+    ``budget`` vale para as heurísticas e é conferido entre as etapas: se
+    acabar, a redução para, nenhum kernel é devolvido e ``report.interrupted``
+    fica verdadeiro (a clique devolvida é a melhor encontrada até então).
+    """
+    clique: Set = set()
+    interrupted = False
+    for heuristic in heuristics:
+        solver = heuristic(graph)
+        result = solver.run(budget=budget)
+        if len(result) > len(clique):
+            clique = result
+        if solver.timed_out:
+            interrupted = True
+            break
+    lower_bound = len(clique)
+    report = ReductionReport(graph, lower_bound)
+
+    def expired() -> bool:
+        report.interrupted = interrupted or (budget is not None and budget.expired())
+        return report.interrupted
+
+    alive = graph.vertices
+    adjacency: Optional[Tuple[List[int], List[Set[int]]]] = None
+    changed = True
+    while changed and alive:
+        if expired():
+            return clique, [], report
+        report.rounds += 1
+        keep, sub = _reduced(graph, alive)
+        _, core = core_decomposition(sub)
+        low = [keep[i] for i in range(len(keep)) if core[i] < lower_bound]
+        alive &= ~mask_from_indices(low, graph.nbytes)
+        report.removed_by_core += len(low)
+        # A poda por core costuma esvaziar grafos esparsos: nada mais a fazer.
+        if not alive:
+            break
+
+        if expired():
+            return clique, [], report
+        adjacency = _adjacency(graph, alive)
+        dominated = _remove_dominated(adjacency, budget)
+        alive &= ~mask_from_indices(dominated, graph.nbytes)
+        report.removed_by_domination += len(dominated)
+        changed = bool(low) or bool(dominated)
+
+    if not alive:
+        return clique, [], report
+    if expired():
+        return clique, [], report
+    # Sem remoções na última rodada, as listas de adjacência ainda valem.
+    keep, adj = adjacency
+    kernels = []
+    for component in _components(adj):
+        if len(component) <= lower_bound:
+            report.removed_small_kernels += len(component)
+            continue
+        kernels.append(graph.induced(mask_from_indices((keep[i] for i in component), graph.nbytes)))
+        report.kernel_sizes.append(len(component))
+        report.reduced_edges += sum(len(adj[i]) for i in component) // 2
+    return clique, kernels, report
+
+
+def _reduced(graph: CompactGraph, alive: int) -> Tuple[List[int], CompactGraph]:
+    # Subgrafo dos vivos reindexado para 0..k-1 (só CSR, O(n + m)) e o
+    # índice original de cada vértice. Nada de bitsets de largura n.
+    if alive == graph.vertices and not graph.is_view:
+        return list(range(graph.n)), graph
+    return list(iter_bits(alive)), graph.subgraph(alive)
+
+
+def _adjacency(graph: CompactGraph, alive: int) -> Tuple[List[int], List[Set[int]]]:
+    # Conjuntos de vizinhos (índices locais) dos vértices vivos: O(n + m).
+    keep, sub = _reduced(graph, alive)
+    indptr, indices = sub.indptr.tolist(), sub.indices.tolist()
+    return keep, [set(indices[indptr[i]:indptr[i + 1]]) for i in range(len(keep))]
+
+
+def _remove_dominated(adjacency: Tuple[List[int], List[Set[int]]], budget: Optional[Budget] = None) -> List[int]:
+    # u é dominado se algum v vivo, não adjacente e distinto de u, é vizinho
+    # de todo N(u): os candidatos partem da vizinhança do vizinho de menor
+    # grau e são intersectados com a dos demais (cada interseção percorre o
+    # conjunto menor), interrompendo assim que ficam vazios. Vértice
+    # isolado é dominado por qualquer outro vivo.
+    # As remoções são sequenciais (u sai das listas dos vizinhos), então
+    # vértices com vizinhanças iguais não removem um ao outro. Se o
+    # orçamento acabar, devolve o que já foi removido (cada remoção vale
+    # sozinha). Devolve os índices originais removidos.
+    keep, adj = adjacency
+    remaining = len(keep)
+    removed = []
+    for u, neighborhood in enumerate(adj):
+        if budget is not None and u % _BUDGET_INTERVAL == 0 and budget.expired():
+            break
+        if neighborhood:
+            w0 = min(neighborhood, key=lambda w: len(adj[w]))
+            candidates = adj[w0] - neighborhood
+            candidates.discard(u)
+            for w in neighborhood:
+                if not candidates:
+                    break
+                if w != w0:
+                    candidates &= adj[w]
+            dominated = bool(candidates)
+        else:
+            dominated = remaining > 1
+        if dominated:
+            for w in neighborhood:
+                adj[w].discard(u)
+            adj[u] = set()
+            remaining -= 1
+            removed.append(keep[u])
+    return removed
+
+
+def _components(adj: List[Set[int]]) -> List[List[int]]:
+    # Busca em largura sobre as listas de adjacência: O(k + m).
+    seen = [False] * len(adj)
+    components = []
+    for start in range(len(adj)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        component = [start]
+        for v in component:
+            for w in adj[v]:
+                if not seen[w]:
+                    seen[w] = True
+                    component.append(w)
+        components.append(component)
+    return components
+
+
+class PreprocessedClique(CliqueAlgorithm):
+    """
+    Roda ``solver_class`` depois do pré-processamento de ``preprocess``.
+
+    Cada kernel é resolvido separadamente (do maior para o menor) por
+    ``solver_class(kernel, **kwargs)``; a resposta é a maior entre as
+    cliques dos kernels e a clique do limite inferior. Como os kernels são
+    visões induzidas, nenhuma adjacência é copiada. ``report`` guarda o
+    ReductionReport da última execução. O orçamento da execução vale também
+    para o pré-processamento.
+    """
+
+    def __init__(self, graph: GraphLike, solver_class: Type[CliqueAlgorithm], **kwargs: Any):
+        super().__init__(graph)
+        self.solver_class = solver_class
+        self.solver_kwargs = kwargs
+        self.report = None
+
+    def _solve(self) -> Set:
+        clique, kernels, self.report = preprocess(self.compact, budget=self.budget)
+        best = set(clique)
+        self._improve_labels(best)
+        if self.report.interrupted:
+            raise SearchInterrupted()
+        for kernel in sorted(kernels, key=len, reverse=True):
+            # Um kernel menor ou igual à melhor clique não pode superá-la.
+            if len(kernel) <= len(best):
+                continue
+            result = self._run_inner(self.solver_class(kernel, **self.solver_kwargs))
+            if len(result) > len(best):
+                best = set(result)
+                self._improve_labels(best)
+        return best
@@ -0,0 +1,264 @@
+import csv
+import math
+import os
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import numpy as np
+from algorithms.base import CliqueAlgorithm, GraphLike
+from algorithms.compact_graph import CompactGraph
+from algorithms.exact.backtracking import BacktrackingClique
+from algorithms.exact.bitboard_branch_bound import BitParallelClique
+from algorithms.exact.brute_force import BruteForceClique
+from algorithms.exact.coloring_branch_bound import ColoringBranchBoundClique
+from algorithms.exact.divide_conquer import DivideConquerClique
+from algorithms.exact.dp_bitmask import DPCliqueBitmask
+from algorithms.heuristics.enhancement.local_search import LocalSearchClique
+from algorithms.heuristics.greedy.greedy_core import GreedyCliqueCoreDecomposition
+from algorithms.heuristics.greedy.greedy_degree import GreedyCliqueDegree
+from algorithms.heuristics.greedy.greedy_min_degree import GreedyCliqueMinDegree
+from algorithms.heuristics.greedy.greedy_restarts import GreedyCliqueWithRestarts
+from algorithms.heuristics.hybrid.coloring_heuristic import ColoringHeuristicClique
+from algorithms.heuristics.metaheuristics.dynamic_local_search import DynamicLocalSearchClique
+from algorithms.heuristics.metaheuristics.genetic_algorithm import GeneticAlgorithmClique
+from algorithms.heuristics.metaheuristics.vectorized_genetic import VectorizedGeneticAlgorithmClique
+from algorithms.ordering import coloring_bound, core_decomposition
+from algorithms.portfolio import PortfolioClique
+from algorithms.preprocessing import PreprocessedClique
+
+# Nome usado no benchmark (coluna "algoritmo" do CSV) -> fábrica do solver.
+ALGORITHMS: Dict[str, Callable[[GraphLike], CliqueAlgorithm]] = {
+    'forca_bruta': BruteForceClique,
+    'forca_bruta_lote': partial(BruteForceClique, mode="batch"),
+    'forca_bruta_reduzido': partial(PreprocessedClique, solver_class=BruteForceClique),
+    'backtracking': BacktrackingClique,
+    'backtracking_paralelo': partial(BacktrackingClique, max_workers=os.cpu_count() or 1),
+    'backtracking_reduzido': partial(PreprocessedClique, solver_class=BacktrackingClique),
+    'divide_conquer': DivideConquerClique,
+    'divide_conquer_reduzido': partial(PreprocessedClique, solver_class=DivideConquerClique),
+    'programacao_dinamica': DPCliqueBitmask,
+    'programacao_dinamica_reduzido': partial(PreprocessedClique, solver_class=DPCliqueBitmask),
+    'programacao_dinamica_compacta': partial(DPCliqueBitmask, mode="compact"),
+    'programacao_dinamica_meio_a_meio': partial(DPCliqueBitmask, mode="split"),
+    'branch_bound_coloracao': ColoringBranchBoundClique,
+    'branch_bound_coloracao_reduzido': partial(PreprocessedClique, solver_class=ColoringBranchBoundClique),
+    'branch_bound_bitparalelo': BitParallelClique,
+    'branch_bound_bitparalelo_reduzido': partial(PreprocessedClique, solver_class=BitParallelClique),
+    'guloso_grau': GreedyCliqueDegree,
+    'guloso_reinicios': GreedyCliqueWithRestarts,
+    'guloso_min_degree': GreedyCliqueMinDegree,
+    'guloso_core': GreedyCliqueCoreDecomposition,
+    "heuristica_coloring": ColoringHeuristicClique,
+    "heuristica_local_search": LocalSearchClique,
+    "meta_heuristica_genetico": GeneticAlgorithmClique,
+    "meta_heuristica_genetico_vetorizado": VectorizedGeneticAlgorithmClique,
+    "meta_heuristica_dls": DynamicLocalSearchClique,
+    "portfolio": PortfolioClique,
+}
+
+# Solvers exatos (e o portfólio, que contém um): os únicos aceitos quando
+# min_quality = 1, já que acertar a ótima no histórico não garante acertá-la
+# num grafo novo.
+EXACT_ALGORITHMS = {
+    'forca_bruta', 'forca_bruta_lote', 'forca_bruta_reduzido', 'backtracking', 'backtracking_paralelo',
+    'backtracking_reduzido', 'divide_conquer', 'divide_conquer_reduzido', 'programacao_dinamica',
+    'programacao_dinamica_reduzido', 'programacao_dinamica_compacta', 'programacao_dinamica_meio_a_meio',
+    'branch_bound_coloracao', 'branch_bound_coloracao_reduzido', 'branch_bound_bitparalelo',
+    'branch_bound_bitparalelo_reduzido', 'portfolio',
+}
+
+# Colunas de features gravadas pelo TestBenchmark no CSV individual.
+FEATURES = ("n", "m", "densidade", "degenerescencia", "assimetria_grau", "limite_coloracao")
+
+DEFAULT_HISTORY = os.path.join("data", "results", "raw", "benchmark_individual.csv")
+
+
+def graph_features(graph: CompactGraph) -> Dict[str, float]:
+    """
+    Features baratas do grafo, O(n + m) no total:
+      - n, m e densidade 2m / (n(n-1));
+      - degenerescência (maior core number, Batagelj–Zaversnik);
+      - assimetria (skewness) da distribuição de graus: alta em scale-free;
+      - limite da coloração gulosa na ordem smallest-last, um limite
+        superior para o tamanho da clique máxima (<= degenerescência + 1).
+    """
+    n = len(graph)
+    m = graph.num_edges()
+    density = 2 * m / (n * (n - 1)) if n > 1 else 0.0
+    order, core = core_decomposition(graph)
+    degeneracy = max((core[v] for v in order), default=0)
+
+    degrees = graph.degrees()[graph.vertex_indices()].astype(np.float64)
+    std = degrees.std() if n else 0.0
+    skew = float(((degrees - degrees.mean()) ** 3).mean() / std ** 3) if std > 0 else 0.0
+
+    return {
+        "n": n,
+        "m": m,
+        "densidade": density,
+        "degenerescencia": degeneracy,
+        "assimetria_grau": skew,
+        "limite_coloracao": coloring_bound(graph, order),
+    }
+
+
+def _design_row(features: Dict[str, float]) -> List[float]:
+    # log do tempo é aproximadamente linear nestes termos: n cobre os
+    # algoritmos exponenciais, log n / log m os polinomiais.
+    n, m = features["n"], features["m"]
+    return [
+        1.0,
+        n,
+        math.log(n + 1),
+        math.log(m + 1),
+        features["densidade"],
+        features["degenerescencia"],
+        features["assimetria_grau"],
+        features["limite_coloracao"],
+    ]
+
+
+class SelectionModel:
+    """
+    Um modelo linear por algoritmo para log(tempo), ajustado por mínimos
+    quadrados (numpy.linalg.lstsq) sobre o CSV individual do benchmark.
+
+    A qualidade de cada execução é tamanho_clique dividido pela maior
+    clique que qualquer algoritmo achou no mesmo grafo (mesmas features).
+    Linhas sem as colunas de features (CSVs antigos) são ignoradas.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mtime: Optional[float] = None
+        self.coefficients: Dict[str, np.ndarray] = {}
+        self.quality: Dict[str, float] = {}
+        self.max_n: Dict[str, int] = {}
+        self.refresh()
+
+    def refresh(self) -> "SelectionModel":
+        """Reajusta o modelo se o CSV mudou desde a última leitura."""
+        mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        if mtime != self.mtime:
+            self.mtime = mtime
+            self._fit(self._read_rows() if mtime is not None else [])
+        return self
+
+    def _read_rows(self) -> List[Tuple[str, Dict[str, float], int, float, bool]]:
+        rows = []
+        with open(self.path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if row.get("erro") == "True" or any(not row.get(name) for name in FEATURES):
+                    continue
+                features = {name: float(row[name]) for name in FEATURES}
+                rows.append((
+                    row["algoritmo"],
+                    features,
+                    int(row["tamanho_clique"]),
+                    float(row["tempo"]),
+                    row.get("timeout") == "True",
+                ))
+        return rows
+
+    def _fit(self, rows: List[Tuple[str, Dict[str, float], int, float, bool]]):
+        self.coefficients, self.quality, self.max_n = {}, {}, {}
+        best: Dict[Tuple[float, ...], int] = {}
+        for _, features, size, _, _ in rows:
+            key = tuple(features[name] for name in FEATURES)
+            best[key] = max(best.get(key, 0), size)
+
+        by_algorithm: Dict[str, List[Tuple[Dict[str, float], float, float]]] = {}
+        for name, features, size, seconds, timed_out in rows:
+            top = best[tuple(features[f] for f in FEATURES)]
+            quality = size / top if top else 1.0
+            # Um timeout não prova nada sobre a clique: conta como falha.
+            if timed_out:
+                quality = 0.0
+            by_algorithm.setdefault(name, []).append((features, seconds, quality))
+
+        for name, samples in by_algorithm.items():
+            X = np.array([_design_row(features) for features, _, _ in samples])
+            y = np.log(np.array([seconds for _, seconds, _ in samples]) + 1e-6)
+            self.coefficients[name] = np.linalg.lstsq(X, y, rcond=None)[0]
+            self.quality[name] = min(quality for _, _, quality in samples)
+            self.max_n[name] = int(max(features["n"] for features, _, _ in samples))
+
+    def predict(self, name: str, features: Dict[str, float]) -> float:
+        """Tempo previsto (s) de ``name`` no grafo com essas features."""
+        return math.exp(float(np.dot(self.coefficients[name], _design_row(features))))
+
+    def select(self, features: Dict[str, float], min_quality: float, candidates) -> Optional[str]:
+        """
+        Algoritmo de menor tempo previsto entre os que atingiram
+        ``min_quality`` em todas as execuções registradas e já foram medidos
+        em grafos pelo menos tão grandes quanto este (sem extrapolar em n).
+        """
+        eligible = [
+            name for name in self.coefficients
+            if name in candidates
+            and self.quality[name] >= min_quality
+            and self.max_n[name] >= features["n"]
+        ]
+        if not eligible:
+            return None
+        return min(eligible, key=lambda name: self.predict(name, features))
+
+
+# Modelos já ajustados, por caminho do CSV (reajustados quando ele muda).
+_MODELS: Dict[str, SelectionModel] = {}
+
+
+def load_model(path: str = DEFAULT_HISTORY) -> SelectionModel:
+    model = _MODELS.get(path)
+    if model is None:
+        model = _MODELS[path] = SelectionModel(path)
+    return model.refresh()
+
+
+class AutoClique(CliqueAlgorithm):
+    """
+    Escolhe e roda o solver previsto como mais rápido para este grafo.
+
+    Calcula ``graph_features`` e consulta o SelectionModel treinado com o
+    histórico do benchmark (``history``), reajustado sempre que o CSV muda.
+    ``min_quality`` é a fração mínima da melhor clique conhecida que o
+    solver precisa ter atingido no histórico; com 1.0 só solvers exatos
+    (EXACT_ALGORITHMS) são considerados.
+    Sem histórico utilizável, regras fixas decidem (``_fallback``).
+
+    ``choice`` e ``features`` guardam a decisão da última execução.
+    """
+
+    def __init__(
+        self,
+        graph: GraphLike,
+        min_quality: float = 1.0,
+        history: str = DEFAULT_HISTORY,
+        algorithms: Optional[Dict[str, Callable[[GraphLike], CliqueAlgorithm]]] = None,
+    ):
+        super().__init__(graph)
+        self.min_quality = min_quality
+        self.history = history
+        self.algorithms = algorithms if algorithms is not None else ALGORITHMS
+        self.choice: Optional[str] = None
+        self.features: Dict[str, float] = {}
+
+    def _solve(self) -> Set:
+        self.features = graph_features(self.compact)
+        model = load_model(self.history)
+        candidates = self.algorithms
+        if self.min_quality >= 1.0:
+            candidates = [name for name in self.algorithms if name in EXACT_ALGORITHMS]
+        self.choice = model.select(self.features, self.min_quality, candidates)
+        if self.choice is None:
+            self.choice = self._fallback(self.features)
+        return self._run_inner(self.algorithms[self.choice](self.compact))
+
+    def _fallback(self, features: Dict[str, float]) -> str:
+        # Regras para quando o histórico não cobre o grafo: gulosos lineares
+        # para grafos enormes, busca local quando a ótima não é exigida e
+        # branch-and-bound bit-paralelo (com redução se o grafo é esparso).
+        if self.min_quality < 1.0:
+            return "heuristica_local_search" if features["n"] <= 5000 else "guloso_core"
+        if features["densidade"] < 0.1:
+            return "branch_bound_bitparalelo_reduzido"
+        return "branch_bound_bitparalelo"
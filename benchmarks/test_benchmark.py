@@ -1,13 +1,18 @@
 import time
-import signal
 import os
 import csv
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, Type
 import statistics
 import tracemalloc
 
+from algorithms.budget import Budget
+from algorithms.compact_graph import CompactGraph
+from algorithms.selection import FEATURES, graph_features
 from benchmarks.test_suite_generator import TestSuiteGenerator
+from graphs.cache import GraphCache
 
 
 class TestBenchmark:
@@ -21,45 +26,41 @@ class TestBenchmark:
 
     # ---------- execução de um algoritmo com timeout e memória ----------
     def run_algorithm(self, AlgoClass, graph, timeout=300):
-        start_time = time.time()
+        # A conversão para CompactGraph fica fora da região medida:
+        # o solver recebe o grafo imutável sem copiá-lo.
+        if not isinstance(graph, CompactGraph):
+            graph = CompactGraph.from_dict(graph)
 
-        class TimeoutError(Exception):
-            pass
+        start_time = time.time()
+        # Trajetória do incumbente: (segundos, tamanho) a cada melhora.
+        incumbents = []
 
-        def timeout_handler(signum, frame):
-            raise TimeoutError()
+        def on_improvement(elapsed, clique):
+            incumbents.append((elapsed, len(clique)))
 
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
+        # O timeout é um Budget consultado pelo próprio solver (sem SIGALRM):
+        # funciona fora da thread principal e, ao estourar, o solver devolve
+        # a melhor clique parcial com timed_out marcado.
+        budget = Budget(timeout=timeout)
 
         try:
             tracemalloc.start()
             instance = AlgoClass(graph)
-            result = instance.run()
+            result = instance.run(budget=budget, on_improvement=on_improvement)
             current, peak = tracemalloc.get_traced_memory()
             tracemalloc.stop()
 
             end_time = time.time()
-            signal.alarm(0)
 
             return {
                 'clique': set(result) if result else set(),
                 'tamanho': len(result) if result else 0,
                 'tempo': end_time - start_time,
                 'memoria': peak / (1024*1024),
-                'timeout': False,
-                'erro': False
-            }
-
-        except TimeoutError:
-            tracemalloc.stop()
-            return {
-                'clique': set(),
-                'tamanho': 0,
-                'tempo': timeout,
-                'memoria': 0,
-                'timeout': True,
-                'erro': False
+                'timeout': instance.timed_out,
+                'erro': False,
+                'incumbentes': incumbents,
+                'tempo_melhor_clique': incumbents[-1][0] if incumbents else 0,
             }
 
         except Exception as e:
@@ -71,7 +72,9 @@ class TestBenchmark:
                 'memoria': 0,
                 'timeout': False,
                 'erro': True,
-                'mensagem_erro': str(e)
+                'mensagem_erro': str(e),
+                'incumbentes': incumbents,
+                'tempo_melhor_clique': 0,
             }
 
     # ---------- salvar resultados individuais ----------
@@ -107,18 +110,30 @@ class TestBenchmark:
 
     # ---------- execução completa de todos os benchmarks ----------
     def run_benchmarks(self, timeout_per_run=300, debug_memory=False):
-        test_suite = TestSuiteGenerator.generate_test_suite()
+        # A suíte é consumida como fluxo de (algoritmo, n, tipo, semente):
+        # cada grafo é carregado do cache em disco (mmap) só na sua vez e
+        # descartado em seguida. O LRU de um item segura apenas o grafo atual.
+        work_items = TestSuiteGenerator.iter_work_items(algorithms=self.algorithm_classes)
+        cache = GraphCache(max_items=1)
         individual_results = []
 
-        for algo_name, graphs in test_suite.items():
+        for algo_name, items in groupby(work_items, key=itemgetter(0)):
             print(f"\n=== Executando algoritmo: {algo_name} ===")
             results_by_n = {}
 
-            for n, tipo_grafo, graph in graphs:
+            for _, n, tipo_grafo, seed in items:
                 if n not in results_by_n:
                     results_by_n[n] = []
 
+                graph = TestSuiteGenerator.load_graph(n, tipo_grafo, seed, cache=cache)
+                # Features do grafo (fora da região medida): alimentam o
+                # modelo de seleção do AutoClique.
+                features = graph_features(graph)
+
                 result = self.run_algorithm(self.algorithm_classes[algo_name], graph, timeout=timeout_per_run)
+                del graph
+                # A clique em si não entra nos CSVs: só o tamanho é guardado.
+                result.pop('clique', None)
                 result['tipo_grafo'] = tipo_grafo
                 results_by_n[n].append(result)
 
@@ -126,11 +141,16 @@ class TestBenchmark:
                     "algoritmo": algo_name,
                     "n": n,
                     "tipo_grafo": tipo_grafo,
+                    "semente": seed,
                     "tamanho_clique": result['tamanho'],
                     "tempo": result['tempo'],
                     "memoria": result['memoria'],
                     "timeout": result['timeout'],
-                    "erro": result['erro']
+                    "erro": result['erro'],
+                    "tempo_melhor_clique": result['tempo_melhor_clique'],
+                    # Trajetória do incumbente: "tempo:tamanho" separados por ";".
+                    "incumbentes": ";".join(f"{t:.4f}:{k}" for t, k in result['incumbentes']),
+                    **{name: features[name] for name in FEATURES if name != "n"},
                 })
 
             # calcular medianas por tamanho
@@ -1,4 +1,6 @@
 import random
+from algorithms.compact_graph import CompactGraph
+from graphs.cache import default_cache
 from graphs.generators import generate_random_graph
 
 class TestSuiteGenerator:
@@ -7,40 +9,100 @@ class TestSuiteGenerator:
     separadas por tipo de algoritmo.
     """
 
+    TIPOS_GRAFO = ("random", "scale_free", "clique")
+
     @staticmethod
-    def generate_graphs_for_algorithm(ns, tipos_grafo=("random", "scale_free", "clique"), instances_per_n=3, **kwargs):
+    def load_graph(n, tipo, seed, cache=None, **kwargs):
         """
-        Gera múltiplas instâncias de grafos de diferentes tipos para cada tamanho n.
-        Retorna lista de tuplas: (n, tipo_grafo, grafo)
+        Grafo (CompactGraph) da instância (n, tipo, semente), gerado ou lido
+        do GraphCache (por padrão o compartilhado da execução): a mesma
+        instância é gerada uma única vez, e não de novo para cada algoritmo
+        nem a cada execução do benchmark.
         """
         from graphs.generators import generate_graph  # usando função que encapsula tipos
 
+        cache = cache if cache is not None else default_cache()
+
+        def build():
+            random.seed(seed)
+            return CompactGraph.from_dict(generate_graph(n, tipo=tipo, **kwargs))
+
+        params = {"n": n, "tipo": tipo, **kwargs}
+        return cache.get("generate_graph", params, seed, build)
+
+    @classmethod
+    def generate_graphs_for_algorithm(cls, ns, tipos_grafo=TIPOS_GRAFO, instances_per_n=3, cache=None, **kwargs):
+        """
+        Gera múltiplas instâncias de grafos de diferentes tipos para cada tamanho n.
+        Retorna lista de tuplas: (n, tipo_grafo, grafo), com grafo em CompactGraph.
+        """
         graphs = []
         for n in ns:
             for seed in range(instances_per_n):
                 for tipo in tipos_grafo:
-                    random.seed(seed)
-                    g = generate_graph(n, tipo=tipo, **kwargs)
+                    g = cls.load_graph(n, tipo, seed, cache=cache, **kwargs)
                     graphs.append((n, tipo, g))  # armazenamos também o tipo de grafo
         return graphs
 
-    @classmethod
-    def generate_test_suite(cls):
+    @staticmethod
+    def suite_plan():
+        """Escada de tamanhos n de cada algoritmo."""
         ns_expo = [6, 8, 10, 12, 14, 16, 18, 20, 22, 24]       # força bruta / DP
+        ns_split = [10, 14, 18, 22, 26, 30, 34, 38, 40, 42]    # DP meio-a-meio
         ns_bt = [10, 12, 14, 16, 18, 20, 22, 24, 26, 28]       # backtracking
+        ns_bb = [30, 50, 80, 100, 150, 200, 250, 300]          # branch-and-bound com coloração
         ns_heur = [30, 50, 80, 120, 200, 300, 450, 700, 900, 1000]        # heurísticas/gulosos
 
-        tipos_grafo = ("random", "scale_free", "clique")
+        return {
+            "forca_bruta": ns_expo,
+            "forca_bruta_lote": ns_expo,
+            "forca_bruta_reduzido": ns_expo,
+            "programacao_dinamica": ns_expo,
+            "programacao_dinamica_reduzido": ns_expo,
+            "programacao_dinamica_compacta": ns_expo,
+            "programacao_dinamica_meio_a_meio": ns_split,
+            "backtracking": ns_bt,
+            "backtracking_paralelo": ns_bt,
+            "backtracking_reduzido": ns_bt,
+            "branch_bound_bitparalelo": ns_bt,
+            "branch_bound_bitparalelo_reduzido": ns_bt,
+            "divide_conquer": ns_bb,
+            "divide_conquer_reduzido": ns_bb,
+            "branch_bound_coloracao": ns_bb,
+            "branch_bound_coloracao_reduzido": ns_bb,
+            "guloso_grau": ns_heur,
+            "guloso_reinicios": ns_heur,
+            "guloso_min_degree": ns_heur,
+            "guloso_core": ns_heur,
+            "heuristica_coloring": ns_heur,
+            "heuristica_local_search": ns_heur,
+            "meta_heuristica_genetico": ns_heur,
+            "meta_heuristica_genetico_vetorizado": ns_heur,
+            "meta_heuristica_dls": ns_heur,
+            "portfolio": ns_bb,
+        }
+
+    @classmethod
+    def iter_work_items(cls, algorithms=None, tipos_grafo=TIPOS_GRAFO, instances_per_n=3):
+        """
+        Suíte como fluxo preguiçoso de itens (algoritmo, n, tipo, semente),
+        na mesma ordem de generate_test_suite. Nenhum grafo é criado aqui:
+        quem consome chama load_graph para cada item e descarta o grafo
+        depois de usá-lo, então a memória fica limitada a um grafo por vez.
+        ``algorithms`` restringe a suíte a esses nomes.
+        """
+        for algo, ns in cls.suite_plan().items():
+            if algorithms is not None and algo not in algorithms:
+                continue
+            for n in ns:
+                for seed in range(instances_per_n):
+                    for tipo in tipos_grafo:
+                        yield algo, n, tipo, seed
 
+    @classmethod
+    def generate_test_suite(cls):
+        """Suíte inteira materializada: {algoritmo: [(n, tipo, grafo), ...]}."""
         return {
-            "forca_bruta": cls.generate_graphs_for_algorithm(ns_expo, tipos_grafo=tipos_grafo),
-            "programacao_dinamica": cls.generate_graphs_for_algorithm(ns_expo, tipos_grafo=tipos_grafo),
-            "backtracking": cls.generate_graphs_for_algorithm(ns_bt, tipos_grafo=tipos_grafo),
-            "guloso_grau": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "guloso_reinicios": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "guloso_min_degree": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "guloso_core": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "heuristica_coloring": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "heuristica_local_search": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
-            "meta_heuristica_genetico": cls.generate_graphs_for_algorithm(ns_heur, tipos_grafo=tipos_grafo),
+            algo: cls.generate_graphs_for_algorithm(ns, tipos_grafo=cls.TIPOS_GRAFO)
+            for algo, ns in cls.suite_plan().items()
         }
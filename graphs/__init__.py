@@ -1 +1,6 @@
-from .generators import generate_random_graph, generate_scale_free_graph, generate_clique_based_graph
+from .generators import (
+    generate_random_graph, generate_scale_free_graph, generate_clique_based_graph,
+    random_edges, scale_free_edges, planted_clique_edges,
+    generate_edges, generate_csr, generate_compact_graph,
+)
+from .cache import GraphCache, default_cache
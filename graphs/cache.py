@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+from algorithms.compact_graph import CompactGraph
+
+# Incrementar quando um gerador mudar de comportamento: invalida o cache.
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join("data", "cache", "graphs")
+
+
+class GraphCache:
+    """
+    Cache de grafos gerados, endereçado pelo conteúdo da receita.
+
+    A chave é o hash de (gerador, parâmetros, semente, versão): a mesma
+    receita sempre produz o mesmo grafo, então não é preciso guardar nada
+    além do resultado. Cada grafo fica em disco como dois arquivos .npy
+    (``indptr`` e ``indices`` do CSR), carregados com ``mmap_mode="r"``: só
+    as páginas lidas pelo solver vão para a memória.
+
+    Acima do disco há uma camada LRU em memória com até ``max_items``
+    grafos, compartilhada por todos os algoritmos da execução: o mesmo
+    CompactGraph (imutável) é devolvido para receitas iguais.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_items: int = 128):
+        self.directory = directory
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, CompactGraph]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(generator: str, params: Dict[str, Any], seed: Optional[int]) -> str:
+        recipe = {"generator": generator, "params": params, "seed": seed, "version": CACHE_VERSION}
+        encoded = json.dumps(recipe, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def get(
+        self,
+        generator: str,
+        params: Dict[str, Any],
+        seed: Optional[int],
+        build: Callable[[], CompactGraph],
+    ) -> CompactGraph:
+        """Grafo da receita: memória, depois disco, e só então ``build()``."""
+        key = self.key(generator, params, seed)
+        with self._lock:
+            graph = self._memory.get(key)
+            if graph is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return graph
+
+        graph = self._load(key)
+        if graph is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            graph = build()
+            self._store(key, graph)
+
+        with self._lock:
+            self._memory[key] = graph
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+        return graph
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+    # ----------------------------------------------------
+    # Disco
+    # ----------------------------------------------------
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key[:2], key)
+        return base + ".indptr.npy", base + ".indices.npy"
+
+    def _load(self, key: str) -> Optional[CompactGraph]:
+        indptr_path, indices_path = self._paths(key)
+        # indptr é gravado por último: se existe, o par está completo.
+        if not os.path.exists(indptr_path):
+            return None
+        indptr = np.load(indptr_path, mmap_mode="r")
+        indices = np.load(indices_path, mmap_mode="r")
+        return CompactGraph.from_csr(indptr, indices)
+
+    def _store(self, key: str, graph: CompactGraph):
+        # Só grafos com rótulos 0..n-1 (o caso dos geradores) cabem no CSR puro.
+        if graph.is_view or any(label != i for i, label in enumerate(graph.labels)):
+            return
+        indptr_path, indices_path = self._paths(key)
+        os.makedirs(os.path.dirname(indptr_path), exist_ok=True)
+        # Escrita atômica: arquivo temporário + os.replace, indptr por último,
+        # então processos concorrentes nunca leem um par pela metade.
+        for path, array in ((indices_path, graph.indices), (indptr_path, graph.indptr)):
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp, path)
+
+
+_DEFAULT_CACHE: Optional[GraphCache] = None
+
+
+def default_cache() -> GraphCache:
+    """Cache compartilhado pela execução (diretório padrão em data/cache)."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = GraphCache()
+    return _DEFAULT_CACHE
@@ -1,5 +1,12 @@
+import math
 import random
+from typing import Optional, Tuple
 import networkx as nx
+import numpy as np
+from algorithms.compact_graph import CompactGraph, edges_to_csr, sorted_unique
+
+# Arestas como par de arrays (origem, destino), com origem > destino.
+EdgeArrays = Tuple[np.ndarray, np.ndarray]
 
 def generate_random_graph(n: int, p: float) -> dict:
     """Gera grafo aleatório Erdős–Rényi G(n, p)."""
@@ -39,6 +46,116 @@ def generate_clique_based_graph(n: int, clique_size: int, noise_edges: int) -> d
 
     return graph
 
+# ----------------------------------------------------
+# Geradores NumPy: arrays de arestas, semente explícita
+# ----------------------------------------------------
+
+def _unique_edges(n: int, src: np.ndarray, dst: np.ndarray) -> EdgeArrays:
+    # Normaliza para origem > destino, remove laços e arestas repetidas.
+    high, low = np.maximum(src, dst), np.minimum(src, dst)
+    keep = high != low
+    keys = sorted_unique(high[keep] * n + low[keep])
+    return np.divmod(keys, n)
+
+
+def random_edges(n: int, p: float, seed: Optional[int] = None) -> EdgeArrays:
+    """
+    G(n, p) por saltos geométricos (Batagelj–Brandes): em vez de sortear
+    cada um dos n(n-1)/2 pares, sorteia a distância até o próximo par
+    escolhido (Geométrica(p)). O(n + m) em vez de O(n²).
+    """
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    if total == 0 or p <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if p >= 1:
+        positions = np.arange(total, dtype=np.int64)
+    else:
+        # Lotes de saltos com folga de ~5 desvios: quase sempre um só lote.
+        expected = total * p
+        batch = int(expected + 5 * math.sqrt(expected) + 16)
+        chunks, last = [], -1
+        while last < total:
+            positions = last + np.cumsum(rng.geometric(p, size=batch))
+            chunks.append(positions)
+            last = int(positions[-1])
+        positions = np.concatenate(chunks)
+        positions = positions[positions < total]
+    # Posição k no triângulo inferior, linha a linha: k = i(i-1)/2 + j, j < i.
+    # A raiz em ponto flutuante pode errar por 1; os dois ajustes corrigem.
+    i = ((1 + np.sqrt(1 + 8 * positions.astype(np.float64))) // 2).astype(np.int64)
+    i -= i * (i - 1) // 2 > positions
+    i += (i + 1) * i // 2 <= positions
+    return i, positions - i * (i - 1) // 2
+
+
+def scale_free_edges(n: int, m: int, seed: Optional[int] = None) -> EdgeArrays:
+    """
+    Barabási–Albert em arrays (Batagelj–Brandes). A lista M guarda as pontas
+    de todas as arestas: M[2i] é o vértice novo da aresta i (i // m) e
+    M[2i+1] = M[r] com r uniforme em [0, 2i], o que escolhe um vértice com
+    probabilidade proporcional ao grau. As cópias M[r] são resolvidas todas
+    de uma vez por saltos de ponteiro (cada rodada dobra o alcance).
+    Laços e arestas repetidas são descartados, como no grafo simples.
+    """
+    if m < 1 or m >= n:
+        raise ValueError(f"Barabási–Albert exige 1 <= m < n (m = {m}, n = {n})")
+    rng = np.random.default_rng(seed)
+    num_edges = n * m
+    edge = np.arange(num_edges, dtype=np.int64)
+    # parent[x] = posição de onde M[x] é copiado; posições pares são raízes.
+    parent = np.arange(2 * num_edges, dtype=np.int64)
+    parent[1::2] = (rng.random(num_edges) * (2 * edge + 1)).astype(np.int64)
+    while True:
+        pending = (parent & 1).astype(bool)
+        if not pending.any():
+            break
+        parent = np.where(pending, parent[parent], parent)
+    targets = (parent[1::2] >> 1) // m
+    return _unique_edges(n, edge // m, targets)
+
+
+def planted_clique_edges(
+    n: int, clique_size: int, noise_edges: int, seed: Optional[int] = None
+) -> EdgeArrays:
+    """Clique nos vértices 0..clique_size-1 + ``noise_edges`` pares aleatórios."""
+    rng = np.random.default_rng(seed)
+    high, low = np.tril_indices(clique_size, -1)
+    noise = rng.integers(0, n, size=(2, noise_edges)) if n else np.zeros((2, 0), dtype=np.int64)
+    return _unique_edges(
+        n,
+        np.concatenate((high.astype(np.int64), noise[0])),
+        np.concatenate((low.astype(np.int64), noise[1])),
+    )
+
+
+def generate_edges(n: int, tipo: str, seed: Optional[int] = None, **kwargs) -> EdgeArrays:
+    """Mesmos tipos e parâmetros padrão de ``generate_graph``, em arrays."""
+    if tipo == "random":
+        return random_edges(n, kwargs.get("p", 0.1), seed)
+    elif tipo == "scale_free":
+        return scale_free_edges(n, kwargs.get("m", 2), seed)
+    elif tipo == "clique":
+        return planted_clique_edges(
+            n,
+            kwargs.get("clique_size", min(5, n)),
+            kwargs.get("noise_edges", n),
+            seed,
+        )
+    else:
+        raise ValueError(f"Tipo de grafo desconhecido: {tipo}")
+
+
+def generate_csr(n: int, tipo: str, seed: Optional[int] = None, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    """(indptr, indices) do grafo, sem passar por dict-de-conjuntos."""
+    return edges_to_csr(n, *generate_edges(n, tipo, seed, **kwargs))
+
+
+def generate_compact_graph(n: int, tipo: str, seed: Optional[int] = None, **kwargs) -> CompactGraph:
+    """CompactGraph direto dos arrays: viável para 10^5–10^6 vértices."""
+    return CompactGraph.from_csr(*generate_csr(n, tipo, seed, **kwargs))
+
+
 def generate_graph(n, tipo, **kwargs):
     if tipo == "random":
         return generate_random_graph(n, kwargs.get("p", 0.1))
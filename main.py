@@ -1,4 +1,3 @@
-import os
 import pandas as pd
 
 from benchmarks import TestBenchmark
@@ -6,11 +5,7 @@ from data import DataCollector
 from data.empirical_analysis.plotter import Plotter
   
 
-from algorithms import (
-    BruteForceClique, BacktrackingClique, DivideConquerClique, DPCliqueBitmask,
-    GreedyCliqueDegree, GreedyCliqueWithRestarts, GreedyCliqueMinDegree, GreedyCliqueCoreDecomposition,
-    ColoringHeuristicClique, LocalSearchClique, GeneticAlgorithmClique
-)
+from algorithms.selection import ALGORITHMS
 
 from data.empirical_analysis import (
     TimeAnalysis,
@@ -23,19 +18,9 @@ def main():
     # -------------------
     # Mapeamento de algoritmos
     # -------------------
-    algorithms = {
-        'forca_bruta': BruteForceClique,
-        'backtracking': BacktrackingClique,
-        'divide_conquer': DivideConquerClique,
-        'programacao_dinamica': DPCliqueBitmask,
-        'guloso_grau': GreedyCliqueDegree,
-        'guloso_reinicios': GreedyCliqueWithRestarts,
-        'guloso_min_degree': GreedyCliqueMinDegree,
-        'guloso_core': GreedyCliqueCoreDecomposition,
-        "heuristica_coloring": ColoringHeuristicClique,
-        "heuristica_local_search": LocalSearchClique,
-        "meta_heuristica_genetico": GeneticAlgorithmClique,
-    }
+    # O registro (nome no benchmark -> solver) fica em algorithms.selection,
+    # compartilhado com o AutoClique, que escolhe entre esses nomes.
+    algorithms = dict(ALGORITHMS)
    
     # -------------------
     # Roda o benchmark (gera CSVs medianos e individuais)
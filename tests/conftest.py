@@ -0,0 +1,30 @@
+import networkx as nx
+import pytest
+
+
+def _as_dict(graph: nx.Graph):
+    return {v: set(graph[v]) for v in graph}
+
+
+@pytest.fixture
+def random_graphs():
+    """Grafos G(n, p) com semente fixa e o ω de referência do networkx."""
+    cases = []
+    for seed, (n, p) in enumerate([(1, 0.0), (12, 0.3), (20, 0.5), (25, 0.7), (30, 0.9)]):
+        graph = nx.gnp_random_graph(n, p, seed=seed)
+        omega = max(len(c) for c in nx.find_cliques(graph))
+        cases.append((_as_dict(graph), omega))
+    return cases
+
+
+@pytest.fixture
+def check_max_clique():
+    """Confere que ``result`` é uma clique de tamanho ω marcada como ótima."""
+
+    def check(graph, omega, result):
+        assert len(result) == omega
+        assert all(v in graph[u] for u in result for v in result if u != v)
+        assert result.optimal
+        assert result.upper_bound == omega
+
+    return check
@@ -0,0 +1,10 @@
+import pytest
+
+from algorithms.exact.backtracking import BacktrackingClique
+
+
+@pytest.mark.parametrize("max_workers, split_depth", [(1, 2), (2, 1), (2, 2)])
+def test_matches_networkx(random_graphs, check_max_clique, max_workers, split_depth):
+    for graph, omega in random_graphs:
+        result = BacktrackingClique(graph, max_workers=max_workers, split_depth=split_depth).run()
+        check_max_clique(graph, omega, result)
@@ -0,0 +1,15 @@
+from algorithms.exact.bitboard_branch_bound import BitParallelClique
+
+
+def test_matches_networkx(random_graphs, check_max_clique):
+    for graph, omega in random_graphs:
+        check_max_clique(graph, omega, BitParallelClique(graph).run())
+
+
+def test_lower_bound_without_better_clique_is_not_optimal(random_graphs):
+    # Com lower_bound = ω não há clique estritamente maior: nada é provado
+    # sobre a clique devolvida, apenas o limite superior.
+    graph, omega = random_graphs[-1]
+    result = BitParallelClique(graph, lower_bound=omega).run()
+    assert not result.optimal
+    assert result.upper_bound == omega
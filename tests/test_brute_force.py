@@ -0,0 +1,12 @@
+import pytest
+
+from algorithms.exact.brute_force import BruteForceClique
+
+
+# Maior n testado por modo: ambos enumeram até 2^n subconjuntos.
+@pytest.mark.parametrize("mode, max_n", [("classic", 20), ("batch", 25)])
+def test_matches_networkx(random_graphs, check_max_clique, mode, max_n):
+    for graph, omega in random_graphs:
+        if len(graph) > max_n:
+            continue
+        check_max_clique(graph, omega, BruteForceClique(graph, mode=mode).run())
@@ -0,0 +1,10 @@
+import pytest
+
+from algorithms.exact.coloring_branch_bound import ColoringBranchBoundClique
+
+
+@pytest.mark.parametrize("renumber", [False, True])
+def test_matches_networkx(random_graphs, check_max_clique, renumber):
+    for graph, omega in random_graphs:
+        result = ColoringBranchBoundClique(graph, renumber=renumber).run()
+        check_max_clique(graph, omega, result)
@@ -0,0 +1,12 @@
+import pytest
+
+from algorithms.exact.divide_conquer import DivideConquerClique
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_matches_networkx(random_graphs, check_max_clique, monkeypatch, max_workers):
+    # Sem o limite mínimo, grafos pequenos também passam pelo ProcessPoolExecutor.
+    monkeypatch.setattr(DivideConquerClique, "PARALLEL_MIN_VERTICES", 0)
+    for graph, omega in random_graphs:
+        result = DivideConquerClique(graph, max_workers=max_workers).run()
+        check_max_clique(graph, omega, result)
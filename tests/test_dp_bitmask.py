@@ -0,0 +1,17 @@
+import pytest
+
+from algorithms.exact.dp_bitmask import DPCliqueBitmask
+
+
+# Maior n testado por modo: a tabela tem 2^n entradas (2^(n/2) no split).
+@pytest.mark.parametrize("mode, max_n", [("classic", 20), ("compact", 25), ("split", 30)])
+def test_matches_networkx(random_graphs, check_max_clique, mode, max_n):
+    for graph, omega in random_graphs:
+        if len(graph) > max_n:
+            continue
+        check_max_clique(graph, omega, DPCliqueBitmask(graph, mode=mode).run())
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        DPCliqueBitmask({0: set()}, mode="sparse")
@@ -0,0 +1,23 @@
+from algorithms.heuristics.metaheuristics.dynamic_local_search import DynamicLocalSearchClique
+
+
+def test_single_vertex_graph_terminates():
+    solver = DynamicLocalSearchClique({0: set()}, seed=0)
+    assert solver.run() == {0}
+    assert solver.steps == 0
+
+
+def test_edgeless_graph_terminates():
+    graph = {v: set() for v in range(5)}
+    solver = DynamicLocalSearchClique(graph, max_steps=50, seed=0)
+    clique = solver.run()
+    assert len(clique) == 1
+    assert solver.steps <= 50
+
+
+def test_step_limit_bounds_penalty_cycles():
+    # Estrela: limite trivial 4 nunca é atingido (ω = 2).
+    graph = {0: {1, 2, 3}, 1: {0}, 2: {0}, 3: {0}}
+    solver = DynamicLocalSearchClique(graph, max_steps=100, seed=0)
+    assert len(solver.run()) == 2
+    assert solver.steps <= 100